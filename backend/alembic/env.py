@@ -28,6 +28,20 @@ if config.config_file_name is not None:
 # add your model's MetaData object here for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Search objects are created with raw DDL (add_post_search_index,
+# add_user_search_index) and are not part of the ORM metadata; keep
+# autogenerate from dropping them
+SEARCH_INDEX_OBJECTS = {
+    "search_vector", "ix_posts_search_vector",
+    "ix_users_name_lower", "ix_users_email_lower", "ix_users_name_trgm", "ix_users_email_trgm",
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and name.startswith("posts_fts"):
+        return False
+    return name not in SEARCH_INDEX_OBJECTS
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -37,6 +51,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -53,7 +68,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
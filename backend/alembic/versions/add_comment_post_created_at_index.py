@@ -0,0 +1,25 @@
+"""Add (post_id, created_at, id) index to comments
+
+Revision ID: add_comment_post_idx
+Revises: add_post_created_at_idx
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_comment_post_idx'
+down_revision = 'add_post_created_at_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-post comment pagination and latest-N previews in feeds
+    op.create_index('ix_comments_post_id_created_at_id', 'comments', ['post_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_post_id_created_at_id', table_name='comments')
@@ -0,0 +1,25 @@
+"""Add (post_id, created_at, id) index to likes
+
+Revision ID: add_like_post_idx
+Revises: add_weekly_tag_counts
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_like_post_idx'
+down_revision = 'add_weekly_tag_counts'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-post likers pagination
+    op.create_index('ix_likes_post_id_created_at_id', 'likes', ['post_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_likes_post_id_created_at_id', table_name='likes')
@@ -0,0 +1,33 @@
+"""Add denormalized like_count and comment_count to posts
+
+Revision ID: add_post_counters
+Revises: add_tags_table_assoc
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_post_counters'
+down_revision = 'add_tags_table_assoc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('posts', sa.Column('like_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('posts', sa.Column('comment_count', sa.Integer(), nullable=False, server_default='0'))
+    
+    # Backfill counters for existing posts
+    op.execute(
+        "UPDATE posts SET "
+        "like_count = (SELECT COUNT(*) FROM likes WHERE likes.post_id = posts.id), "
+        "comment_count = (SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('posts', 'comment_count')
+    op.drop_column('posts', 'like_count')
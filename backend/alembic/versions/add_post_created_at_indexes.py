@@ -0,0 +1,28 @@
+"""Add created_at indexes to posts
+
+Revision ID: add_post_created_at_idx
+Revises: add_post_counters
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_post_created_at_idx'
+down_revision = 'add_post_counters'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Day/week range filters and keyset pagination over the whole feed
+    op.create_index('ix_posts_created_at_id', 'posts', ['created_at', 'id'])
+    # Same, scoped to one user's timeline
+    op.create_index('ix_posts_user_id_created_at_id', 'posts', ['user_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_user_id_created_at_id', table_name='posts')
+    op.drop_index('ix_posts_created_at_id', table_name='posts')
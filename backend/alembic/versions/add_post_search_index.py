@@ -0,0 +1,71 @@
+"""Add full-text search index on posts.content
+
+Revision ID: add_post_search_index
+Revises: add_comment_post_idx
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_post_search_index'
+down_revision = 'add_comment_post_idx'
+branch_labels = None
+depends_on = None
+
+
+# The DDL below is deliberately frozen rather than imported from
+# app.services.search, so this revision keeps producing the same schema if the
+# service's create_search_index() changes later. Change it with a new revision.
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Generated column: existing rows are indexed as part of the ALTER
+        op.execute(
+            "ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED"
+        )
+        op.execute("CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING GIN (search_vector)")
+        return
+
+    # SQLite: external-content FTS5 table kept in sync by triggers. It is keyed
+    # on posts' implicit rowid, which VACUUM may renumber: run vacuum_db.py
+    # (VACUUM + 'rebuild') instead of a bare VACUUM.
+    op.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(content, content='posts', content_rowid='rowid')"
+    )
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+            INSERT INTO posts_fts(rowid, content) VALUES (new.rowid, new.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+            INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF content ON posts BEGIN
+            INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+            INSERT INTO posts_fts(rowid, content) VALUES (new.rowid, new.content);
+        END
+    """)
+    # Index existing posts
+    op.execute("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_posts_search_vector")
+        op.execute("ALTER TABLE posts DROP COLUMN IF EXISTS search_vector")
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS posts_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS posts_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS posts_fts_ai")
+    op.execute("DROP TABLE IF EXISTS posts_fts")
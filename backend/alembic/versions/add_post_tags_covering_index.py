@@ -0,0 +1,28 @@
+"""Add (tag_name, post_id) covering index to post_tags
+
+Revision ID: add_post_tags_tag_post_idx
+Revises: add_user_search_index
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_post_tags_tag_post_idx'
+down_revision = 'add_user_search_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tag-filtered feeds resolve post ids from the index alone; the
+    # single-column tag_name index becomes redundant
+    op.create_index('ix_post_tags_tag_name_post_id', 'post_tags', ['tag_name', 'post_id'])
+    op.drop_index('ix_post_tags_tag_name', table_name='post_tags')
+
+
+def downgrade() -> None:
+    op.create_index('ix_post_tags_tag_name', 'post_tags', ['tag_name'])
+    op.drop_index('ix_post_tags_tag_name_post_id', table_name='post_tags')
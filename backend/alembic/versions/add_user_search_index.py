@@ -0,0 +1,39 @@
+"""Add typeahead indexes on users.name and users.email
+
+Revision ID: add_user_search_index
+Revises: add_post_search_index
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_user_search_index'
+down_revision = 'add_post_search_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Prefix matches (LIKE 'q%') on the btree indexes, similarity on the trigram ones
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_name_lower ON users (lower(name) text_pattern_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email) text_pattern_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_name_trgm ON users USING GIN (lower(name) gin_trgm_ops)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING GIN (lower(email) gin_trgm_ops)")
+        return
+
+    # SQLite: normalized-prefix range scans on expression indexes
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_name_lower ON users (lower(name))")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_users_email_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_users_email_lower")
+    op.execute("DROP INDEX IF EXISTS ix_users_name_lower")
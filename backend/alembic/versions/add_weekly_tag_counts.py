@@ -0,0 +1,53 @@
+"""Add weekly_tag_counts rollup table
+
+Revision ID: add_weekly_tag_counts
+Revises: add_post_tags_tag_post_idx
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_weekly_tag_counts'
+down_revision = 'add_post_tags_tag_post_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'weekly_tag_counts',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('week_start', sa.DateTime(), nullable=False),
+        sa.Column('tag', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'week_start', 'tag')
+    )
+    
+    # Backfill from existing posts: one row per (user, UTC Monday, category),
+    # where the category is the first tag or 'other' (see app.services.rollup)
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        week_start = "date_trunc('week', created_at)"
+        category = "coalesce(tags::jsonb ->> 0, 'other')"
+    else:
+        # Match SQLAlchemy's SQLite DateTime storage format so lookups by
+        # week_start compare equal
+        week_start = (
+            "date(created_at, '-' || ((CAST(strftime('%w', created_at) AS INTEGER) + 6) % 7) || ' days')"
+            " || ' 00:00:00.000000'"
+        )
+        category = "coalesce(json_extract(tags, '$[0]'), 'other')"
+    op.execute(
+        "INSERT INTO weekly_tag_counts (user_id, week_start, tag, count) "
+        f"SELECT user_id, {week_start}, {category}, COUNT(*) FROM posts "
+        "WHERE user_id IS NOT NULL "
+        f"GROUP BY user_id, {week_start}, {category}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('weekly_tag_counts')
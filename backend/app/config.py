@@ -21,6 +21,35 @@ class Settings(BaseSettings):
     # CORS
     frontend_url: str = "http://localhost:5173"
     
+    # Response compression (brotli is used when the package is installed)
+    compression_minimum_size: int = 1024  # bytes; smaller bodies are sent as-is
+    gzip_compression_level: int = 6  # 1 (fastest) - 9 (smallest)
+    brotli_compression_quality: int = 4  # 0 (fastest) - 11 (smallest)
+    
+    # Anonymous response cache (set either to 0 to disable)
+    response_cache_max_entries: int = 512
+    response_cache_ttl_seconds: float = 30.0
+    
+    # Cached groupings of completed weeks in weekly reports (0 disables); the
+    # TTL bounds staleness from post edits handled by other workers
+    week_cache_max_entries: int = 4096
+    week_cache_ttl_seconds: float = 300.0
+    
+    # Write-behind like buffer for hot posts: intents are flushed in one
+    # transaction every like_buffer_flush_ms or like_buffer_max_events intents
+    like_buffer_enabled: bool = False
+    like_buffer_flush_ms: int = 200
+    like_buffer_max_events: int = 500
+    
+    # Per-user liked post ids for is_liked; the TTL bounds staleness from other workers
+    liked_posts_cache_max_users: int = 10000
+    liked_posts_cache_max_ids: int = 1000000
+    liked_posts_cache_max_ids_per_user: int = 20000
+    liked_posts_cache_ttl_seconds: float = 60.0
+    
+    # In-memory tag registry; reloaded periodically to see tags created by other workers
+    tag_registry_refresh_seconds: float = 300.0
+    
     @property
     def get_database_url(self) -> str:
         """Get database URL, defaulting to SQLite if not set"""
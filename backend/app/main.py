@@ -5,7 +5,14 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
 import traceback
 from app.config import settings
-from app.routers import auth, posts, comments, likes, users, search
+from app.routers import auth, posts, comments, likes, users, search, export, tags, reports
+from app.middleware.compression import CompressionMiddleware
+from app.services.cache import response_cache
+from app.services.tags import tag_registry
+from app.services.week_cache import week_report_cache
+from app.services.like_buffer import like_buffer
+from app.services.liked_cache import liked_posts_cache
+from app.database import SessionLocal
 
 # Configure logging
 logging.basicConfig(
@@ -104,6 +111,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (feeds, weekly reports, exports)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.gzip_compression_level,
+    brotli_quality=settings.brotli_compression_quality,
+)
+
 # Log startup
 @app.on_event("startup")
 async def startup_event():
@@ -115,10 +130,26 @@ async def startup_event():
     # Log registered routes for debugging
     auth_routes = [route for route in app.routes if hasattr(route, "path") and "/auth" in route.path]
     logger.info(f"Registered auth routes: {[route.path for route in auth_routes if hasattr(route, 'path')]}")
+    
+    # Warm the tag registry so tag lookups don't need queries
+    db = SessionLocal()
+    try:
+        tag_registry.load(db)
+    except Exception as e:
+        # Tables may not exist yet; the registry loads lazily on first use
+        logger.warning(f"Could not load tag registry at startup: {type(e).__name__} - {str(e)}")
+    finally:
+        db.close()
+    
+    if like_buffer.enabled:
+        logger.info(f"Like buffer enabled: flush every {settings.like_buffer_flush_ms} ms or {settings.like_buffer_max_events} events")
+        like_buffer.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("BBS API shutting down...")
+    # Write any buffered like intents before exiting
+    like_buffer.stop()
 
 # Include routers
 app.include_router(auth.router, prefix="/auth")
@@ -127,6 +158,9 @@ app.include_router(comments.router)
 app.include_router(likes.router)
 app.include_router(users.router)
 app.include_router(search.router)
+app.include_router(export.router)
+app.include_router(tags.router)
+app.include_router(reports.router)
 
 
 @app.get("/")
@@ -139,6 +173,22 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Report response, weekly report and liked posts cache hit rates and sizes"""
+    return {
+        **response_cache.stats(),
+        "week_reports": week_report_cache.stats(),
+        "liked_posts": liked_posts_cache.stats(),
+    }
+
+
+@app.get("/likes/buffer/stats")
+async def like_buffer_stats():
+    """Report write-behind like buffer flush latency and batch sizes"""
+    return like_buffer.stats()
+
+
 @app.get("/routes")
 async def list_routes():
     """List all registered routes for debugging"""
@@ -0,0 +1,175 @@
+"""Negotiated response compression (brotli when installed, otherwise gzip)."""
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import zlib
+
+# brotli is optional; without it only gzip is offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported encoding from an Accept-Encoding header"""
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        parts = item.strip().split(";")
+        name = parts[0].strip()
+        quality = 1.0
+        for param in parts[1:]:
+            param = param.strip()
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        # wbits=31 produces a gzip container
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """Buffers the response start, then decides whether and how to compress"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream_send = send
+        self.start_message: Message | None = None
+        self.encoder = None
+        self.passthrough = False
+        self.buffer = b""
+
+    def make_encoder(self):
+        if self.encoding == "br":
+            return BrotliEncoder(self.middleware.brotli_quality)
+        return GzipEncoder(self.middleware.gzip_level)
+
+    def should_skip(self, headers: Headers) -> bool:
+        status = self.start_message["status"]
+        if status < 200 or status in (204, 304):
+            return True
+        if "content-encoding" in headers:
+            return True
+        content_type = headers.get("content-type", "")
+        return not content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def update_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # The encoded body is a different representation; keep ETags
+        # comparable under weak comparison (If-None-Match)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.downstream_send(message)
+            return
+
+        if self.passthrough:
+            await self.downstream_send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            headers = Headers(raw=self.start_message["headers"])
+            if self.should_skip(headers):
+                await self.start_passthrough(message)
+                return
+
+            # Upstream middleware may deliver even small bodies in several
+            # chunks, so buffer until the size threshold is known to be met
+            self.buffer += body
+            if more_body and len(self.buffer) < self.middleware.minimum_size:
+                return
+            body, self.buffer = self.buffer, b""
+            if not more_body and len(body) < self.middleware.minimum_size:
+                await self.start_passthrough({"type": "http.response.body", "body": body})
+                return
+
+            self.encoder = self.make_encoder()
+            mutable_headers = MutableHeaders(raw=self.start_message["headers"])
+            self.update_headers(mutable_headers)
+            if not more_body:
+                # Whole body available: compress in one go with an exact length
+                compressed = self.encoder.compress(body) + self.encoder.flush()
+                mutable_headers["Content-Length"] = str(len(compressed))
+                await self.downstream_send(self.start_message)
+                await self.downstream_send({"type": "http.response.body", "body": compressed})
+                return
+            del mutable_headers["Content-Length"]
+            await self.downstream_send(self.start_message)
+
+        chunk = self.encoder.compress(body)
+        if not more_body:
+            chunk += self.encoder.flush()
+        await self.downstream_send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def start_passthrough(self, message: Message) -> None:
+        """Send the response unmodified from here on"""
+        self.passthrough = True
+        await self.downstream_send(self.start_message)
+        await self.downstream_send(message)
@@ -3,5 +3,6 @@ from app.models.post import Post
 from app.models.comment import Comment
 from app.models.like import Like
 from app.models.tag import Tag
+from app.models.weekly_tag_count import WeeklyTagCount
 
-__all__ = ["User", "Post", "Comment", "Like", "Tag"]
+__all__ = ["User", "Post", "Comment", "Like", "Tag", "WeeklyTagCount"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, DateTime, Boolean, ForeignKey, String
+from sqlalchemy import Column, Text, DateTime, Boolean, ForeignKey, String, Index
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -21,3 +21,6 @@ class Comment(Base):
     # Relationships
     post = relationship("Post", back_populates="comments")
     user = relationship("User", back_populates="comments")
+    
+    # Serve per-post comment pagination and latest-N previews
+    __table_args__ = (Index("ix_comments_post_id_created_at_id", "post_id", "created_at", "id"),)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 import uuid
 from datetime import datetime
@@ -18,5 +18,9 @@ class Like(Base):
     post = relationship("Post", back_populates="likes")
     user = relationship("User", back_populates="likes")
     
-    # Unique constraint to prevent duplicate likes
-    __table_args__ = (UniqueConstraint("post_id", "user_id", name="unique_post_user_like"),)
+    __table_args__ = (
+        # Unique constraint to prevent duplicate likes
+        UniqueConstraint("post_id", "user_id", name="unique_post_user_like"),
+        # Keyset pagination of a post's likers, newest first
+        Index("ix_likes_post_id_created_at_id", "post_id", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, DateTime, Boolean, ForeignKey, String
+from sqlalchemy import Column, Text, DateTime, Boolean, ForeignKey, String, Integer, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects import sqlite
@@ -38,9 +38,18 @@ class Post(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, nullable=True)
     is_edited = Column(Boolean, default=False, nullable=False)
+    # Denormalized counters, maintained on write (see app/services/counters.py)
+    like_count = Column(Integer, default=0, server_default="0", nullable=False)
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="posts")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     likes = relationship("Like", back_populates="post", cascade="all, delete-orphan")
     tag_objects = relationship("Tag", secondary=post_tags, back_populates="posts")
+    
+    # Serve feed/timeline keyset pagination and created_at range filters
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
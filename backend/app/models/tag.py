@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Table, ForeignKey
+from sqlalchemy import Column, String, Table, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 from app.models.uuid_type import GUID
@@ -10,7 +10,9 @@ post_tags = Table(
     'post_tags',
     Base.metadata,
     Column('post_id', GUID(), ForeignKey('posts.id', ondelete='CASCADE'), primary_key=True),
-    Column('tag_name', String, ForeignKey('tags.name', ondelete='CASCADE'), primary_key=True)
+    Column('tag_name', String, ForeignKey('tags.name', ondelete='CASCADE'), primary_key=True),
+    # Covering index for tag -> posts lookups (tag-filtered feeds)
+    Index('ix_post_tags_tag_name_post_id', 'tag_name', 'post_id')
 )
 
 
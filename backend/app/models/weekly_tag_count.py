@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey
+from app.database import Base
+from app.models.uuid_type import GUID
+
+
+class WeeklyTagCount(Base):
+    """Rollup of posts per (user, UTC week, category); see app.services.rollup"""
+    __tablename__ = "weekly_tag_counts"
+    
+    user_id = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    week_start = Column(DateTime, primary_key=True)  # Monday 00:00 UTC
+    tag = Column(String, primary_key=True)  # Post's first tag, or "other"
+    count = Column(Integer, nullable=False, default=0, server_default="0")
@@ -11,6 +11,7 @@ from app.models.user import User
 from app.schemas.user import User as UserSchema
 from app.services.oauth import get_google_access_token, get_google_user_info
 from app.services.auth import create_access_token, create_refresh_token
+from app.services.cache import bump_data_version
 from app.middleware.auth import get_current_user
 from app.config import settings
 from pydantic import BaseModel
@@ -95,6 +96,8 @@ async def google_callback(code: str, db: Session = Depends(get_db)):
             logger.debug("New user added to database")
         
         db.commit()
+        # Login refreshes name/avatar, which cached post payloads embed
+        bump_data_version()
         db.refresh(user)
         logger.info(f"User {user.id} authenticated successfully")
         
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from datetime import datetime
 from uuid import UUID
@@ -7,14 +7,58 @@ import logging
 from app.database import get_db
 from app.models.comment import Comment
 from app.models.post import Post
-from app.schemas.comment import Comment as CommentSchema, CommentCreate, CommentUpdate, CommentWithUser
+from app.schemas.comment import Comment as CommentSchema, CommentCreate, CommentUpdate, CommentWithUser, CommentPage
 from app.middleware.auth import get_current_user, get_optional_user
+from app.services.counters import adjust_comment_count
+from app.services.cache import bump_data_version, json_response
+from app.services.hydration import load_users, build_comment
+from app.services.pagination import paginate_keyset
+from app.services.serialization import dumps
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["comments"])
 
 
+@router.get("/posts/{post_id}/comments", response_model=CommentPage)
+async def get_comments(
+    post_id: UUID,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Get comments on a post, oldest first, with cursor pagination"""
+    try:
+        logger.debug(f"Fetching comments for post {post_id} - cursor: {cursor}, limit: {limit}")
+        post = db.query(Post).filter(Post.id == post_id).first()
+        if not post:
+            logger.warning(f"Post {post_id} not found for comments query")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+        
+        query = db.query(Comment).filter(Comment.post_id == post_id)
+        try:
+            comments, next_cursor = paginate_keyset(
+                query, Comment.created_at, Comment.id, cursor, limit, newest_first=False
+            )
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        
+        users = load_users(db, {comment.user_id for comment in comments})
+        return json_response(dumps({
+            "items": [build_comment(comment, users) for comment in comments],
+            "next_cursor": next_cursor,
+            "total": post.comment_count
+        }))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching comments for post {post_id}: {type(e).__name__} - {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch comments"
+        )
+
+
 @router.post("/posts/{post_id}/comments", response_model=CommentWithUser, status_code=status.HTTP_201_CREATED)
 async def create_comment(
     post_id: UUID,
@@ -49,7 +93,9 @@ async def create_comment(
             )
         
         db.add(db_comment)
+        adjust_comment_count(db, post_id, 1)
         db.commit()
+        bump_data_version()
         db.refresh(db_comment)
         logger.info(f"Comment {db_comment.id} created successfully on post {post_id}")
         
@@ -100,6 +146,7 @@ async def update_comment(
         comment.is_edited = True
     
     db.commit()
+    bump_data_version()
     db.refresh(comment)
     return CommentSchema.model_validate(comment)
 
@@ -123,5 +170,7 @@ async def delete_comment(
         )
     
     db.delete(comment)
+    adjust_comment_count(db, comment.post_id, -1)
     db.commit()
+    bump_data_version()
     return None
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from datetime import date
+from typing import Optional
+from uuid import UUID
+import logging
+from app.database import SessionLocal
+from app.middleware.auth import get_current_user
+from app.models.user import User
+from app.services.dates import local_day_bounds_utc
+from app.services.export import iter_post_export_lines
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+
+def stream_posts(user_id: UUID | None, start, end, batch_size: int):
+    """Run the export on its own session so it outlives the request's dependencies"""
+    db = SessionLocal()
+    try:
+        yield from iter_post_export_lines(db, user_id, start, end, batch_size)
+    finally:
+        db.close()
+
+
+@router.get("/posts")
+async def export_posts(
+    user_id: Optional[UUID] = Query(None),
+    start_date: Optional[date] = Query(None, description="First local day to include (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Last local day to include (YYYY-MM-DD)"),
+    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)"),
+    batch_size: int = Query(1000, ge=100, le=10000),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream posts with tags, counts and authors as NDJSON (requires authentication)"""
+    if start_date and end_date and end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date"
+        )
+    
+    start = local_day_bounds_utc(start_date, timezone_offset)[0] if start_date else None
+    end = local_day_bounds_utc(end_date, timezone_offset)[1] if end_date else None
+    logger.info(
+        f"User {current_user.id} exporting posts - user_id: {user_id}, "
+        f"start: {start}, end: {end}, batch_size: {batch_size}"
+    )
+    
+    return StreamingResponse(
+        stream_posts(user_id, start, end, batch_size),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="posts.ndjson"'}
+    )
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from typing import Optional
 from uuid import UUID
 import logging
 from app.database import get_db
 from app.models.like import Like
 from app.models.post import Post
-from app.middleware.auth import get_current_user
+from app.middleware.auth import get_current_user, get_optional_user
+from app.services.likes import toggle_post_like
+from app.services.like_buffer import like_buffer
+from app.services.liked_cache import liked_posts_cache
+from app.services.pagination import paginate_keyset
+from app.services.hydration import load_liked_post_ids
+from app.schemas.like import LikeStatusRequest, LikeStatus
+from app.services.cache import bump_data_version
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -22,38 +29,26 @@ async def toggle_like(
     """Toggle like on post (requires authentication)"""
     try:
         logger.info(f"User {current_user.id} toggling like on post {post_id}")
-        # Verify post exists
-        post = db.query(Post).filter(Post.id == post_id).first()
-        if not post:
+        if like_buffer.enabled:
+            # Write-behind: record the intent; the flusher writes it in a batch
+            result = like_buffer.toggle(db, post_id, current_user.id)
+        else:
+            # Toggle and read the new count in one transaction, without a
+            # read-then-write race between concurrent clicks
+            result = toggle_post_like(db, post_id, current_user.id)
+        if result is None:
+            db.rollback()
             logger.warning(f"Post {post_id} not found for like toggle")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
         
-        # Check if like already exists
-        existing_like = db.query(Like).filter(
-            Like.post_id == post_id,
-            Like.user_id == current_user.id
-        ).first()
-        
-        if existing_like:
-            # Unlike
-            logger.debug(f"Removing like from post {post_id} by user {current_user.id}")
-            db.delete(existing_like)
-            db.commit()
-            like_count = db.query(func.count(Like.id)).filter(Like.post_id == post_id).scalar() or 0
-            logger.info(f"Post {post_id} unliked by user {current_user.id}, new count: {like_count}")
-            return {"liked": False, "like_count": like_count}
-        else:
-            # Like
-            logger.debug(f"Adding like to post {post_id} by user {current_user.id}")
-            new_like = Like(
-                post_id=post_id,
-                user_id=current_user.id
-            )
-            db.add(new_like)
-            db.commit()
-            like_count = db.query(func.count(Like.id)).filter(Like.post_id == post_id).scalar() or 0
-            logger.info(f"Post {post_id} liked by user {current_user.id}, new count: {like_count}")
-            return {"liked": True, "like_count": like_count}
+        liked, like_count = result
+        db.commit()
+        # Buffered intents bump the data version once per flush instead
+        if not like_buffer.enabled:
+            bump_data_version()
+        liked_posts_cache.update(current_user.id, post_id, liked)
+        logger.info(f"Post {post_id} {'liked' if liked else 'unliked'} by user {current_user.id}, new count: {like_count}")
+        return {"liked": liked, "like_count": like_count}
     except HTTPException:
         raise
     except Exception as e:
@@ -67,26 +62,39 @@ async def toggle_like(
 @router.get("/posts/{post_id}/likes")
 async def get_likes(
     post_id: UUID,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
 ):
-    """Get like count and list of users who liked the post"""
+    """Get like count and a page of users who liked the post, most recent first"""
     try:
         logger.debug(f"Fetching likes for post {post_id}")
-        # Verify post exists
-        post = db.query(Post).filter(Post.id == post_id).first()
-        if not post:
+        # Verify post exists; the total comes from the stored counter
+        like_count = db.query(Post.like_count).filter(Post.id == post_id).scalar()
+        if like_count is None:
             logger.warning(f"Post {post_id} not found for likes query")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+        like_count = max(like_count + like_buffer.pending_delta(post_id), 0)
         
-        likes = db.query(Like).filter(Like.post_id == post_id).all()
-        like_count = len(likes)
-        logger.debug(f"Found {like_count} likes for post {post_id}")
-        
-        users = [like.user for like in likes]
+        # Likers and their profile columns in one query, paged on the
+        # (post_id, created_at, id) index
+        query = db.query(
+            Like.id,
+            Like.created_at,
+            User.id.label("user_id"),
+            User.name,
+            User.avatar_url
+        ).join(User, User.id == Like.user_id).filter(Like.post_id == post_id)
+        try:
+            likes, next_cursor = paginate_keyset(query, Like.created_at, Like.id, cursor, limit)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        logger.debug(f"Returning {len(likes)} of {like_count} likes for post {post_id}")
         
         return {
             "like_count": like_count,
-            "users": [{"id": str(u.id), "name": u.name, "avatar_url": u.avatar_url} for u in users]
+            "users": [{"id": str(like.user_id), "name": like.name, "avatar_url": like.avatar_url} for like in likes],
+            "next_cursor": next_cursor
         }
     except HTTPException:
         raise
@@ -96,3 +104,42 @@ async def get_likes(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch likes"
         )
+
+
+@router.post("/likes/status", response_model=dict[UUID, LikeStatus])
+async def get_like_status(
+    request: LikeStatusRequest,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user)
+):
+    """Like counts and the viewer's is_liked for many posts; unknown ids are omitted"""
+    try:
+        # LikeStatusRequest caps the id count; larger bodies fail validation (422)
+        post_ids = list(dict.fromkeys(request.post_ids))
+        if not post_ids:
+            return {}
+        
+        # Counts from the stored counters and the viewer's likes: two IN-list queries
+        like_counts = dict(db.query(Post.id, Post.like_count).filter(Post.id.in_(post_ids)).all())
+        liked_post_ids, like_deltas = like_buffer.overlay(
+            list(like_counts),
+            current_user.id if current_user else None,
+            load_liked_post_ids(db, list(like_counts), current_user)
+        )
+        logger.debug(f"Returning like status for {len(like_counts)} of {len(post_ids)} posts")
+        
+        return {
+            post_id: {
+                "like_count": max(like_count + like_deltas.get(post_id, 0), 0),
+                "is_liked": post_id in liked_post_ids
+            }
+            for post_id, like_count in like_counts.items()
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching like status: {type(e).__name__} - {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch like status"
+        )
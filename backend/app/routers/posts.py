@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import select, func
 from datetime import datetime, date
 from typing import Optional
 from uuid import UUID
@@ -8,128 +8,148 @@ import hashlib
 import logging
 from app.database import get_db
 from app.models.post import Post
-from app.models.like import Like
-from app.models.tag import Tag
-from app.schemas.post import Post as PostSchema, PostCreate, PostUpdate, PostWithUser
-from app.schemas.comment import CommentWithUser
+from app.models.tag import Tag, post_tags
+from app.schemas.post import Post as PostSchema, PostCreate, PostUpdate, PostWithUser, PostPage
 from app.middleware.auth import get_current_user, get_optional_user
+from app.services.hydration import load_post_context, build_posts
+from app.services.pagination import paginate_keyset
+from app.services.dates import local_day_bounds_utc
+from app.services.cache import response_cache, bump_data_version, cache_key, cached_response, json_response
+from app.services.etag import make_etag, etag_matches, not_modified
+from app.services.serialization import dumps
+from app.services.tags import tag_registry
+from app.services.upsert import insert_ignore
+from app.services.rollup import adjust_weekly_tag_count, rollup_category
+from app.services.week_cache import invalidate_post_week
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/posts", tags=["posts"])
 
+MAX_FILTER_TAGS = 10
 
-def sync_post_tags(db: Session, post: Post, tag_names: list[str]):
+
+def sync_post_tags(db: Session, post: Post, tag_names: list[str], is_new: bool = False):
     """
     Sync tags for a post: create tags in the tags table if they don't exist,
-    and update the post's tag relationships and JSON column.
+    and rewrite the post's post_tags rows and JSON column.
+    is_new skips clearing old associations for a post that has none yet.
+    Callers add the names to tag_registry once the transaction commits.
     """
-    if not tag_names:
-        # Clear all tags
-        post.tag_objects = []
-        post.tags = []
-        return
+    unique_names = list(dict.fromkeys(tag_names))
     
-    # Ensure all tags exist in the tags table
-    tag_objects = []
-    for tag_name in tag_names:
-        # Get or create tag
-        tag = db.query(Tag).filter(Tag.name == tag_name).first()
-        if not tag:
-            tag = Tag(name=tag_name)
-            db.add(tag)
-            db.flush()  # Flush to get the tag in the session
-            logger.debug(f"Created new tag: {tag_name}")
-        tag_objects.append(tag)
+    # Only names the registry doesn't know need a lookup: one IN query, then
+    # one insert for the new ones (concurrent creators of the same tag are
+    # absorbed by ON CONFLICT DO NOTHING)
+    known_names = tag_registry.names(db)
+    missing = [tag_name for tag_name in unique_names if tag_name not in known_names]
+    if missing:
+        existing = {row[0] for row in db.query(Tag.name).filter(Tag.name.in_(missing)).all()}
+        new_names = [tag_name for tag_name in missing if tag_name not in existing]
+        if new_names:
+            db.execute(insert_ignore(db, Tag.__table__), [{"name": tag_name} for tag_name in new_names])
+            logger.debug(f"Created new tags: {new_names}")
     
-    # Update post's tag relationships
-    post.tag_objects = tag_objects
+    # Replace the association rows in bulk (executemany) rather than through
+    # the tag_objects relationship, which would load both sides first
+    if not is_new:
+        db.execute(post_tags.delete().where(post_tags.c.post_id == post.id))
+    if unique_names:
+        db.execute(
+            post_tags.insert(),
+            [{"post_id": post.id, "tag_name": tag_name} for tag_name in unique_names]
+        )
     # Also update the JSON column for backward compatibility
     post.tags = tag_names
 
 
-@router.get("", response_model=list[PostWithUser])
+def filter_posts_by_tags(query, tag_names: list[str], match_all: bool):
+    """
+    Restrict a Post query to posts carrying any (or all) of tag_names,
+    resolved through the post_tags index rather than the JSON column.
+    """
+    tag_names = list(dict.fromkeys(tag_names))
+    tagged = select(post_tags.c.post_id).where(post_tags.c.tag_name.in_(tag_names))
+    if match_all and len(tag_names) > 1:
+        tagged = tagged.group_by(post_tags.c.post_id).having(func.count() == len(tag_names))
+    return query.filter(Post.id.in_(tagged))
+
+
+@router.get("", response_model=PostPage)
 async def get_posts(
-    page: int = Query(1, ge=1),
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
     limit: int = Query(20, ge=1, le=100),
     user_id: Optional[UUID] = Query(None),
+    tag: Optional[list[str]] = Query(None, description="Only posts with these tags (repeatable)"),
+    tag_match: str = Query("any", regex="^(any|all)$", description="Match any or all of the given tags"),
     date: Optional[str] = Query(None),
+    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)"),
+    comment_preview: Optional[int] = Query(None, ge=0, le=50, description="Embed only the latest N comments per post"),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user)
 ):
-    """Get all posts with pagination"""
+    """Get all posts, newest first, with cursor pagination"""
     try:
-        logger.info(f"Fetching posts - page: {page}, limit: {limit}, user_id: {user_id}, date: {date}")
+        logger.info(f"Fetching posts - cursor: {cursor}, limit: {limit}, user_id: {user_id}, tag: {tag} ({tag_match}), date: {date}, timezone_offset: {timezone_offset}")
+        # Anonymous viewers all see the same page, so serve it from the cache
+        cache_version = response_cache.version
+        if current_user is None:
+            key = cache_key(request)
+            cached = cached_response(request, key)
+            if cached is not None:
+                return cached
+        
         query = db.query(Post)
         
         if user_id:
             query = query.filter(Post.user_id == user_id)
         
+        if tag:
+            if len(tag) > MAX_FILTER_TAGS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"At most {MAX_FILTER_TAGS} tags can be filtered on"
+                )
+            query = filter_posts_by_tags(query, tag, match_all=(tag_match == "all"))
+        
         if date:
             try:
                 filter_date = datetime.strptime(date, '%Y-%m-%d').date()
-                # Filter posts created on the specified date
-                # Use date() function to extract date part (works with SQLite and PostgreSQL)
+                # Filter posts created on the specified local date using a
+                # half-open created_at range so the index can serve it
+                day_start, day_end = local_day_bounds_utc(filter_date, timezone_offset)
                 query = query.filter(
-                    func.date(Post.created_at) == filter_date
+                    Post.created_at >= day_start,
+                    Post.created_at < day_end
                 )
             except ValueError as e:
                 # Invalid date format, ignore the filter
                 logger.warning(f"Invalid date format provided: {date} - {str(e)}")
                 pass
         
-        posts = query.order_by(desc(Post.created_at)).offset((page - 1) * limit).limit(limit).all()
+        try:
+            posts, next_cursor = paginate_keyset(query, Post.created_at, Post.id, cursor, limit)
+        except ValueError as e:
+            logger.warning(f"Invalid cursor provided: {cursor} - {str(e)}")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
         logger.debug(f"Found {len(posts)} posts")
         
-        result = []
-        for post in posts:
-            # Get comments with user info
-            comments = post.comments
-            comments_with_user = []
-            for comment in comments:
-                comment_dict = CommentWithUser(
-                    id=comment.id,
-                    post_id=comment.post_id,
-                    user_id=comment.user_id,
-                    anonymous_name=comment.anonymous_name,
-                    content=comment.content,
-                    created_at=comment.created_at,
-                    updated_at=comment.updated_at,
-                    is_edited=comment.is_edited,
-                    user=comment.user if comment.user_id else None
-                )
-                comments_with_user.append(comment_dict)
-            
-            # Get like count
-            like_count = db.query(func.count(Like.id)).filter(Like.post_id == post.id).scalar() or 0
-            
-            # Check if current user liked this post
-            is_liked = False
-            if current_user:
-                is_liked = db.query(Like).filter(
-                    Like.post_id == post.id,
-                    Like.user_id == current_user.id
-                ).first() is not None
-            
-            # Create PostWithUser with all data
-            post_dict = PostWithUser(
-                id=post.id,
-                user_id=post.user_id,
-                anonymous_name=post.anonymous_name,
-                content=post.content,
-                tags=post.tags or [],
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                is_edited=post.is_edited,
-                user=post.user if post.user_id else None,
-                comments=comments_with_user,
-                like_count=like_count,
-                is_liked=is_liked
-            )
-            result.append(post_dict)
+        # Answer conditional requests before building any response objects
+        context = load_post_context(db, posts, current_user, comment_limit=comment_preview)
+        etag = make_etag(next_cursor, context.fingerprint())
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        
+        result = build_posts(context)
         
         logger.info(f"Returning {len(result)} posts")
-        return result
+        body = dumps({"items": result, "next_cursor": next_cursor})
+        if current_user is None:
+            response_cache.set(key, (etag, body), cache_version)
+        return json_response(body, etag)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching posts: {type(e).__name__} - {str(e)}", exc_info=True)
         raise HTTPException(
@@ -141,63 +161,37 @@ async def get_posts(
 @router.get("/{post_id}", response_model=PostWithUser)
 async def get_post(
     post_id: UUID,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_user)
 ):
     """Get single post with comments"""
     try:
         logger.info(f"Fetching post {post_id}")
+        cache_version = response_cache.version
+        if current_user is None:
+            key = cache_key(request)
+            cached = cached_response(request, key)
+            if cached is not None:
+                return cached
+        
         post = db.query(Post).filter(Post.id == post_id).first()
         if not post:
             logger.warning(f"Post {post_id} not found")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
         
-        # Get comments with user info
-        comments = post.comments
-        comments_with_user = []
-        for comment in comments:
-            comment_dict = CommentWithUser(
-                id=comment.id,
-                post_id=comment.post_id,
-                user_id=comment.user_id,
-                anonymous_name=comment.anonymous_name,
-                content=comment.content,
-                created_at=comment.created_at,
-                updated_at=comment.updated_at,
-                is_edited=comment.is_edited,
-                user=comment.user if comment.user_id else None
-            )
-            comments_with_user.append(comment_dict)
+        context = load_post_context(db, [post], current_user)
+        etag = make_etag(context.fingerprint())
+        if etag_matches(request, etag):
+            return not_modified(etag)
         
-        # Get like count
-        like_count = db.query(func.count(Like.id)).filter(Like.post_id == post.id).scalar() or 0
+        post_dict = build_posts(context)[0]
         
-        # Check if current user liked this post
-        is_liked = False
-        if current_user:
-            is_liked = db.query(Like).filter(
-                Like.post_id == post.id,
-                Like.user_id == current_user.id
-            ).first() is not None
-        
-        # Create PostWithUser with all data
-        post_dict = PostWithUser(
-            id=post.id,
-            user_id=post.user_id,
-            anonymous_name=post.anonymous_name,
-            content=post.content,
-            tags=post.tags or [],
-            created_at=post.created_at,
-            updated_at=post.updated_at,
-            is_edited=post.is_edited,
-            user=post.user if post.user_id else None,
-            comments=comments_with_user,
-            like_count=like_count,
-            is_liked=is_liked
-        )
-        
-        logger.debug(f"Returning post {post_id} with {len(comments_with_user)} comments")
-        return post_dict
+        logger.debug(f"Returning post {post_id} with {len(post_dict['comments'])} comments")
+        body = dumps(post_dict)
+        if current_user is None:
+            response_cache.set(key, (etag, body), cache_version)
+        return json_response(body, etag)
     except HTTPException:
         raise
     except Exception as e:
@@ -305,10 +299,14 @@ async def create_post(
         
         # Sync tags (create tags in tags table if needed)
         if post.tags:
-            sync_post_tags(db, db_post, post.tags)
+            sync_post_tags(db, db_post, post.tags, is_new=True)
+        adjust_weekly_tag_count(db, db_post.user_id, db_post.created_at, db_post.tags, 1)
         
         db.commit()
+        bump_data_version()
+        tag_registry.add(db_post.tags or [])
         db.refresh(db_post)
+        invalidate_post_week(db_post.user_id, db_post.created_at)
         logger.info(f"Post {db_post.id} created successfully")
         return PostSchema.model_validate(db_post)
     except Exception as e:
@@ -349,12 +347,21 @@ async def update_post(
             post.is_edited = True
         if post_update.tags is not None:
             logger.debug(f"Updating tags for post {post_id}")
+            old_tags = list(post.tags or [])
             # Sync tags (create tags in tags table if needed)
             sync_post_tags(db, post, post_update.tags)
             post.updated_at = datetime.utcnow()
             post.is_edited = True
+            # Move the post between weekly rollup buckets if its category changed
+            if rollup_category(old_tags) != rollup_category(post.tags):
+                adjust_weekly_tag_count(db, post.user_id, post.created_at, old_tags, -1)
+                adjust_weekly_tag_count(db, post.user_id, post.created_at, post.tags, 1)
         
         db.commit()
+        bump_data_version()
+        if post_update.tags is not None:
+            tag_registry.add(post_update.tags)
+            invalidate_post_week(post.user_id, post.created_at)
         db.refresh(post)
         logger.info(f"Post {post_id} updated successfully")
         return PostSchema.model_validate(post)
@@ -390,8 +397,12 @@ async def delete_post(
                 detail="Not authorized to delete this post"
             )
         
+        user_id, created_at = post.user_id, post.created_at
+        adjust_weekly_tag_count(db, user_id, created_at, post.tags, -1)
         db.delete(post)
         db.commit()
+        bump_data_version()
+        invalidate_post_week(user_id, created_at)
         logger.info(f"Post {post_id} deleted successfully by user {current_user.id}")
         return None
     except HTTPException:
@@ -406,14 +417,26 @@ async def delete_post(
 
 @router.get("/tags/all", response_model=list[str])
 async def get_all_tags(
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Get all available tags that have been used in posts"""
     try:
-        tags = db.query(Tag).order_by(Tag.name).all()
-        tag_names = [tag.name for tag in tags]
+        # The tag list is the same for every viewer
+        cache_version = response_cache.version
+        key = cache_key(request)
+        cached = cached_response(request, key)
+        if cached is not None:
+            return cached
+        
+        tag_names = sorted(tag_registry.names(db))
+        etag = make_etag(tag_names)
+        if etag_matches(request, etag):
+            return not_modified(etag)
         logger.debug(f"Returning {len(tag_names)} tags")
-        return tag_names
+        body = dumps(tag_names)
+        response_cache.set(key, (etag, body), cache_version)
+        return json_response(body, etag)
     except Exception as e:
         logger.error(f"Error fetching tags: {type(e).__name__} - {str(e)}", exc_info=True)
         raise HTTPException(
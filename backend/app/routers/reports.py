@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+import logging
+from app.database import get_db
+from app.models.user import User
+from app.schemas.report import WeeklyReportPage
+from app.middleware.auth import get_optional_user
+from app.services.pagination import paginate_keyset
+from app.services.reports import build_weekly_reports, build_weekly_report_counts
+from app.services.cache import json_response
+from app.services.serialization import dumps, serialize_user
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/reports", tags=["reports"])
+
+
+@router.get("/weekly", response_model=WeeklyReportPage)
+async def get_site_weekly_reports(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(20, ge=1, le=100, description="Users per page"),
+    user_id: Optional[UUID] = Query(None, description="Only this user's reports"),
+    weeks: int = Query(4, ge=1, le=12),
+    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)"),
+    detail: str = Query("posts", regex="^(counts|posts)$", description="'counts' returns tag counts only, without posts"),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user)
+):
+    """Get weekly tag reports for every user (one page of users at a time), in a single grouped pass"""
+    try:
+        logger.info(f"Fetching site weekly reports - cursor: {cursor}, limit: {limit}, user_id: {user_id}, weeks: {weeks}, detail: {detail}")
+        query = db.query(User)
+        if user_id:
+            query = query.filter(User.id == user_id)
+        
+        # Users are paged oldest account first
+        try:
+            users, next_cursor = paginate_keyset(query, User.created_at, User.id, cursor, limit, newest_first=False)
+        except ValueError as e:
+            logger.warning(f"Invalid cursor provided: {cursor} - {str(e)}")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        
+        user_ids = [user.id for user in users]
+        if detail == "counts":
+            reports = build_weekly_report_counts(db, user_ids, weeks, timezone_offset)
+        else:
+            reports = build_weekly_reports(db, user_ids, weeks, timezone_offset, current_user)
+        items = [{"user": serialize_user(user), "reports": reports[user.id]} for user in users]
+        return json_response(dumps({"items": items, "next_cursor": next_cursor}))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching site weekly reports: {type(e).__name__} - {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch weekly reports"
+        )
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func, desc
+from sqlalchemy import or_
 from typing import Optional
 from app.database import get_db
 from app.models.post import Post
 from app.models.user import User
-from app.schemas.post import PostWithUser
-from app.schemas.user import User as UserSchema
+from app.middleware.auth import get_optional_user
+from app.services.hydration import hydrate_posts
+from app.services.search import search_posts
+from app.services.serialization import dumps, serialize_user
+from app.services.cache import json_response
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
@@ -15,32 +18,37 @@ router = APIRouter(prefix="/api/search", tags=["search"])
 async def search(
     q: str = Query(..., min_length=1),
     type: Optional[str] = Query("all", regex="^(posts|users|all)$"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user)
 ):
-    """Search posts and users"""
+    """Search posts (full-text, most relevant first) and users"""
     results = {
         "posts": [],
-        "users": []
+        "users": [],
+        "next_cursor": None
     }
     
     if type in ("posts", "all"):
-        # Search posts by content
-        posts = db.query(Post).filter(
-            Post.content.ilike(f"%{q}%")
-        ).order_by(desc(Post.created_at)).limit(50).all()
+        try:
+            matches, results["next_cursor"] = search_posts(db, q, cursor, limit)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
         
-        for post in posts:
-            # Get like count
-            like_count = db.query(func.count()).select_from(Post).join(
-                Post.likes
-            ).filter(Post.id == post.id).scalar() or 0
-            
-            post_dict = PostWithUser.model_validate(post)
-            post_dict.like_count = like_count
-            post_dict.is_liked = False  # Could be enhanced to check current user
-            results["posts"].append(post_dict)
+        if matches:
+            posts_by_id = {
+                post.id: post
+                for post in db.query(Post).filter(Post.id.in_([post_id for post_id, _ in matches])).all()
+            }
+            # Keep relevance order; skip rows deleted since the index was read
+            posts = [posts_by_id[post_id] for post_id, _ in matches if post_id in posts_by_id]
+            snippets = dict(matches)
+            results["posts"] = hydrate_posts(db, posts, current_user)
+            for post in results["posts"]:
+                post["snippet"] = snippets[post["id"]]
     
-    if type in ("users", "all"):
+    if type in ("users", "all") and not cursor:
         # Search users by name or email
         users = db.query(User).filter(
             or_(
@@ -49,6 +57,6 @@ async def search(
             )
         ).limit(20).all()
         
-        results["users"] = [UserSchema.model_validate(user) for user in users]
+        results["users"] = [serialize_user(user) for user in users]
     
-    return results
+    return json_response(dumps(results))
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+import logging
+from app.database import get_db
+from app.models.tag import post_tags
+from app.schemas.tag import TagUsage
+from app.services.tags import tag_registry
+from app.services.cache import response_cache, cache_key, cached_response, json_response
+from app.services.etag import make_etag, etag_matches, not_modified
+from app.services.serialization import dumps
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/tags", tags=["tags"])
+
+
+def normalize_tag_prefix(value: str) -> str:
+    """Lowercase and drop a leading '#' so 'run' and '#Run' both match '#running'"""
+    return value.strip().lower().lstrip("#")
+
+
+@router.get("", response_model=list[TagUsage])
+async def get_tags(
+    request: Request,
+    prefix: str = Query("", max_length=100, description="Only tags starting with this (case-insensitive, '#' optional)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Get tags ranked by how many posts use them, optionally filtered by prefix"""
+    try:
+        cache_version = response_cache.version
+        key = cache_key(request)
+        cached = cached_response(request, key)
+        if cached is not None:
+            return cached
+        
+        # Candidate names come from the in-memory registry; only their
+        # usage counts hit the database
+        normalized = normalize_tag_prefix(prefix)
+        names = [
+            name for name in tag_registry.names(db)
+            if normalize_tag_prefix(name).startswith(normalized)
+        ]
+        counts = {}
+        if names:
+            query = db.query(post_tags.c.tag_name, func.count()).group_by(post_tags.c.tag_name)
+            if normalized:
+                query = query.filter(post_tags.c.tag_name.in_(names))
+            counts = dict(query.all())
+        
+        ranked = sorted(names, key=lambda name: (-counts.get(name, 0), name))[:limit]
+        result = [{"name": name, "count": counts.get(name, 0)} for name in ranked]
+        etag = make_etag(result)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        body = dumps(result)
+        response_cache.set(key, (etag, body), cache_version)
+        return json_response(body, etag)
+    except Exception as e:
+        logger.error(f"Error fetching tag usage: {type(e).__name__} - {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch tags"
+        )
@@ -1,30 +1,57 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
 from uuid import UUID
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, date, timedelta, timezone
 from typing import List, Optional
-from pydantic import BaseModel
 from app.database import get_db
 from app.models.user import User
 from app.models.post import Post
-from app.models.like import Like
-from app.models.tag import Tag
 from app.schemas.user import User as UserSchema, UserUpdate
-from app.schemas.post import PostWithUser
-from app.schemas.comment import CommentWithUser
+from app.schemas.post import PostPage
+from app.schemas.report import WeeklySummaryItem, WeeklyReport
 from app.middleware.auth import get_current_user, get_optional_user
+from app.services.hydration import hydrate_posts
+from app.services.pagination import paginate_keyset
+from app.services.cache import bump_data_version, json_response
+from app.services.etag import make_etag, etag_matches, not_modified
+from app.services.serialization import dumps, serialize_user
+from app.services.search import autocomplete_users
+from app.services.tags import tag_registry
+from app.services.dates import local_day_bounds_utc
+from app.services.reports import (
+    group_posts_by_tag, build_weekly_reports, build_weekly_report_counts, count_posts_by_category,
+    post_category_expression
+)
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 
 @router.get("", response_model=list[UserSchema])
 async def get_users(
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Get all users"""
     users = db.query(User).order_by(User.name).all()
-    return [UserSchema.model_validate(user) for user in users]
+    # Answer conditional requests before validating/serializing every user
+    etag = make_etag(tuple(
+        (user.id, user.name, user.email, user.avatar_url, user.bio, user.created_at, user.last_login)
+        for user in users
+    ))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return json_response(dumps([serialize_user(user) for user in users]), etag)
+
+
+@router.get("/autocomplete", response_model=list[UserSchema])
+async def autocomplete(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db)
+):
+    """Typeahead for mentions and the user filter: top users by name/email prefix or similarity"""
+    users = autocomplete_users(db, q, limit)
+    return json_response(dumps([serialize_user(user) for user in users]))
 
 
 @router.get("/{user_id}", response_model=UserSchema)
@@ -61,77 +88,36 @@ async def update_user(
         current_user.avatar_url = user_update.avatar_url
     
     db.commit()
+    # Author names and avatars are embedded in cached post payloads
+    bump_data_version()
     db.refresh(current_user)
     return UserSchema.model_validate(current_user)
 
 
-@router.get("/{user_id}/posts", response_model=list[PostWithUser])
+@router.get("/{user_id}/posts", response_model=PostPage)
 async def get_user_posts(
     user_id: UUID,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    comment_preview: Optional[int] = Query(None, ge=0, le=50, description="Embed only the latest N comments per post"),
     db: Session = Depends(get_db),
     current_user: User | None = Depends(get_optional_user)
 ):
-    """Get posts by user"""
+    """Get posts by user, newest first, with cursor pagination"""
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    posts = db.query(Post).filter(Post.user_id == user_id).order_by(desc(Post.created_at)).all()
+    query = db.query(Post).filter(Post.user_id == user_id)
+    try:
+        posts, next_cursor = paginate_keyset(query, Post.created_at, Post.id, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
     
-    result = []
-    for post in posts:
-        # Get comments with user info
-        comments = post.comments
-        comments_with_user = []
-        for comment in comments:
-            comment_dict = CommentWithUser(
-                id=comment.id,
-                post_id=comment.post_id,
-                user_id=comment.user_id,
-                anonymous_name=comment.anonymous_name,
-                content=comment.content,
-                created_at=comment.created_at,
-                updated_at=comment.updated_at,
-                is_edited=comment.is_edited,
-                user=comment.user if comment.user_id else None
-            )
-            comments_with_user.append(comment_dict)
-        
-        # Get like count
-        like_count = db.query(func.count(Like.id)).filter(Like.post_id == post.id).scalar() or 0
-        
-        # Check if current user liked this post
-        is_liked = False
-        if current_user:
-            is_liked = db.query(Like).filter(
-                Like.post_id == post.id,
-                Like.user_id == current_user.id
-            ).first() is not None
-        
-        # Create PostWithUser with all data
-        post_dict = PostWithUser(
-            id=post.id,
-            user_id=post.user_id,
-            anonymous_name=post.anonymous_name,
-            content=post.content,
-            tags=post.tags or [],
-            created_at=post.created_at,
-            updated_at=post.updated_at,
-            is_edited=post.is_edited,
-            user=post.user if post.user_id else None,
-            comments=comments_with_user,
-            like_count=like_count,
-            is_liked=is_liked
-        )
-        result.append(post_dict)
-    
-    return result
-
-
-class WeeklySummaryItem(BaseModel):
-    tag: str
-    count: int
-    posts: List[PostWithUser] = []
+    return json_response(dumps({
+        "items": hydrate_posts(db, posts, current_user, comment_limit=comment_preview),
+        "next_cursor": next_cursor
+    }))
 
 
 @router.get("/{user_id}/weekly-summary", response_model=List[WeeklySummaryItem])
@@ -139,11 +125,10 @@ async def get_weekly_summary(
     user_id: UUID,
     db: Session = Depends(get_db),
     current_user: User | None = Depends(get_optional_user),
-    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)")
+    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)"),
+    detail: str = Query("posts", regex="^(counts|posts)$", description="'counts' returns tag counts only, without posts")
 ):
     """Get weekly summary of user's posts grouped by tags"""
-    import re
-    
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -166,6 +151,10 @@ async def get_weekly_summary(
         end_date = utc_now.replace(tzinfo=None)
         start_date = (end_date - timedelta(days=7))
     
+    if detail == "counts":
+        # Aggregate in the database; posts are fetched per bucket on demand
+        return json_response(dumps(count_posts_by_category(db, user_id, start_date, end_date)))
+    
     # Get posts from this week
     posts = db.query(Post).filter(
         Post.user_id == user_id,
@@ -173,291 +162,22 @@ async def get_weekly_summary(
         Post.created_at <= end_date
     ).all()
     
-    # Get all tags from the tags table
-    all_tags = db.query(Tag).order_by(Tag.name).all()
-    available_tag_names = {tag.name for tag in all_tags}
-    
-    # Group posts by tag
-    tag_posts: dict[str, list[Post]] = {}
-    other_posts: list[Post] = []
-    processed_posts = set()  # Track which posts have been added to a category
-    
-    for post in posts:
-        tags = post.tags or []
-        
-        if tags:
-            # Check if post has any tags that exist in the database
-            has_valid_tag = False
-            for tag in tags:
-                if tag in available_tag_names:
-                    has_valid_tag = True
-                    if tag not in tag_posts:
-                        tag_posts[tag] = []
-                    if post.id not in processed_posts:
-                        tag_posts[tag].append(post)
-                        processed_posts.add(post.id)
-            
-            # If post has tags but none are in the database, add to "other"
-            if not has_valid_tag and post.id not in processed_posts:
-                other_posts.append(post)
-                processed_posts.add(post.id)
-        else:
-            # Posts without tags go to "other"
-            if post.id not in processed_posts:
-                other_posts.append(post)
-                processed_posts.add(post.id)
+    # Known tag names come from the in-memory registry
+    available_tag_names = tag_registry.names(db)
     
-    # Build result with posts
-    result = []
-    
-    # Add tagged categories (sorted by tag name)
-    for tag_name in sorted(tag_posts.keys()):
-        tag_post_list = tag_posts[tag_name]
-        # Convert posts to PostWithUser format
-        posts_with_user = []
-        for post in tag_post_list:
-            # Get like count
-            like_count = db.query(func.count(Like.id)).filter(Like.post_id == post.id).scalar() or 0
-            # Check if current user liked this post
-            is_liked = False
-            if current_user:
-                is_liked = db.query(Like).filter(
-                    Like.post_id == post.id,
-                    Like.user_id == current_user.id
-                ).first() is not None
-            # Get comments
-            comments_with_user = []
-            for comment in post.comments:
-                comment_dict = CommentWithUser(
-                    id=comment.id,
-                    post_id=comment.post_id,
-                    user_id=comment.user_id,
-                    anonymous_name=comment.anonymous_name,
-                    content=comment.content,
-                    created_at=comment.created_at,
-                    updated_at=comment.updated_at,
-                    is_edited=comment.is_edited,
-                    user=comment.user if comment.user_id else None
-                )
-                comments_with_user.append(comment_dict)
-            
-            post_dict = PostWithUser(
-                id=post.id,
-                user_id=post.user_id,
-                anonymous_name=post.anonymous_name,
-                content=post.content,
-                tags=post.tags or [],
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                is_edited=post.is_edited,
-                user=post.user if post.user_id else None,
-                comments=comments_with_user,
-                like_count=like_count,
-                is_liked=is_liked
-            )
-            posts_with_user.append(post_dict)
-        
-        result.append(WeeklySummaryItem(
-            tag=tag_name,
-            count=len(tag_post_list),
-            posts=posts_with_user
-        ))
-    
-    # Add "other" category if there are posts without tags
-    if other_posts:
-        other_posts_with_user = []
-        for post in other_posts:
-            like_count = db.query(func.count(Like.id)).filter(Like.post_id == post.id).scalar() or 0
-            is_liked = False
-            if current_user:
-                is_liked = db.query(Like).filter(
-                    Like.post_id == post.id,
-                    Like.user_id == current_user.id
-                ).first() is not None
-            comments_with_user = []
-            for comment in post.comments:
-                comment_dict = CommentWithUser(
-                    id=comment.id,
-                    post_id=comment.post_id,
-                    user_id=comment.user_id,
-                    anonymous_name=comment.anonymous_name,
-                    content=comment.content,
-                    created_at=comment.created_at,
-                    updated_at=comment.updated_at,
-                    is_edited=comment.is_edited,
-                    user=comment.user if comment.user_id else None
-                )
-                comments_with_user.append(comment_dict)
-            
-            post_dict = PostWithUser(
-                id=post.id,
-                user_id=post.user_id,
-                anonymous_name=post.anonymous_name,
-                content=post.content,
-                tags=post.tags or [],
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                is_edited=post.is_edited,
-                user=post.user if post.user_id else None,
-                comments=comments_with_user,
-                like_count=like_count,
-                is_liked=is_liked
-            )
-            other_posts_with_user.append(post_dict)
-        
-        result.append(WeeklySummaryItem(
-            tag='other',
-            count=len(other_posts),
-            posts=other_posts_with_user
-        ))
-    
-    # Sort by count (descending)
-    result.sort(key=lambda x: x.count, reverse=True)
-    
-    return result
+    return json_response(dumps(build_weekly_summary_for_range(posts, available_tag_names, db, current_user)))
 
 
 def build_weekly_summary_for_range(
     posts: list[Post],
-    available_tag_names: set[str],
+    available_tag_names: frozenset[str],
     db: Session,
     current_user: User | None
-) -> List[WeeklySummaryItem]:
-    """Helper function to build weekly summary for a date range"""
-    # Group posts by tag
-    tag_posts: dict[str, list[Post]] = {}
-    other_posts: list[Post] = []
-    processed_posts = set()
-    
-    for post in posts:
-        tags = post.tags or []
-        
-        if tags:
-            has_valid_tag = False
-            for tag in tags:
-                if tag in available_tag_names:
-                    has_valid_tag = True
-                    if tag not in tag_posts:
-                        tag_posts[tag] = []
-                    if post.id not in processed_posts:
-                        tag_posts[tag].append(post)
-                        processed_posts.add(post.id)
-            
-            if not has_valid_tag and post.id not in processed_posts:
-                other_posts.append(post)
-                processed_posts.add(post.id)
-        else:
-            if post.id not in processed_posts:
-                other_posts.append(post)
-                processed_posts.add(post.id)
-    
-    result = []
-    
-    # Add tagged categories (sorted by tag name)
-    for tag_name in sorted(tag_posts.keys()):
-        tag_post_list = tag_posts[tag_name]
-        posts_with_user = []
-        for post in tag_post_list:
-            like_count = db.query(func.count(Like.id)).filter(Like.post_id == post.id).scalar() or 0
-            is_liked = False
-            if current_user:
-                is_liked = db.query(Like).filter(
-                    Like.post_id == post.id,
-                    Like.user_id == current_user.id
-                ).first() is not None
-            comments_with_user = []
-            for comment in post.comments:
-                comment_dict = CommentWithUser(
-                    id=comment.id,
-                    post_id=comment.post_id,
-                    user_id=comment.user_id,
-                    anonymous_name=comment.anonymous_name,
-                    content=comment.content,
-                    created_at=comment.created_at,
-                    updated_at=comment.updated_at,
-                    is_edited=comment.is_edited,
-                    user=comment.user if comment.user_id else None
-                )
-                comments_with_user.append(comment_dict)
-            
-            post_dict = PostWithUser(
-                id=post.id,
-                user_id=post.user_id,
-                anonymous_name=post.anonymous_name,
-                content=post.content,
-                tags=post.tags or [],
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                is_edited=post.is_edited,
-                user=post.user if post.user_id else None,
-                comments=comments_with_user,
-                like_count=like_count,
-                is_liked=is_liked
-            )
-            posts_with_user.append(post_dict)
-        
-        result.append(WeeklySummaryItem(
-            tag=tag_name,
-            count=len(tag_post_list),
-            posts=posts_with_user
-        ))
-    
-    # Add "other" category
-    if other_posts:
-        other_posts_with_user = []
-        for post in other_posts:
-            like_count = db.query(func.count(Like.id)).filter(Like.post_id == post.id).scalar() or 0
-            is_liked = False
-            if current_user:
-                is_liked = db.query(Like).filter(
-                    Like.post_id == post.id,
-                    Like.user_id == current_user.id
-                ).first() is not None
-            comments_with_user = []
-            for comment in post.comments:
-                comment_dict = CommentWithUser(
-                    id=comment.id,
-                    post_id=comment.post_id,
-                    user_id=comment.user_id,
-                    anonymous_name=comment.anonymous_name,
-                    content=comment.content,
-                    created_at=comment.created_at,
-                    updated_at=comment.updated_at,
-                    is_edited=comment.is_edited,
-                    user=comment.user if comment.user_id else None
-                )
-                comments_with_user.append(comment_dict)
-            
-            post_dict = PostWithUser(
-                id=post.id,
-                user_id=post.user_id,
-                anonymous_name=post.anonymous_name,
-                content=post.content,
-                tags=post.tags or [],
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                is_edited=post.is_edited,
-                user=post.user if post.user_id else None,
-                comments=comments_with_user,
-                like_count=like_count,
-                is_liked=is_liked
-            )
-            other_posts_with_user.append(post_dict)
-        
-        result.append(WeeklySummaryItem(
-            tag='other',
-            count=len(other_posts),
-            posts=other_posts_with_user
-        ))
-    
-    result.sort(key=lambda x: x.count, reverse=True)
-    return result
-
-
-class WeeklyReport(BaseModel):
-    week_start: str
-    week_end: str
-    categories: List[WeeklySummaryItem]
+) -> list[dict]:
+    """Helper function to build weekly summary (WeeklySummaryItem dicts) for a date range"""
+    # Hydrate every post in the range at once, then regroup
+    hydrated = {post["id"]: post for post in hydrate_posts(db, posts, current_user)}
+    return group_posts_by_tag(posts, available_tag_names, hydrated)
 
 
 @router.get("/{user_id}/weekly-reports", response_model=List[WeeklyReport])
@@ -466,64 +186,52 @@ async def get_weekly_reports(
     db: Session = Depends(get_db),
     current_user: User | None = Depends(get_optional_user),
     weeks: int = Query(4, ge=1, le=12),  # Number of weeks to return, default 4
-    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)")
+    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)"),
+    detail: str = Query("posts", regex="^(counts|posts)$", description="'counts' returns tag counts only, without posts")
 ):
     """Get weekly reports for multiple weeks, sorted by week range"""
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    # Get all tags from the tags table
-    all_tags = db.query(Tag).order_by(Tag.name).all()
-    available_tag_names = {tag.name for tag in all_tags}
-    
-    reports = []
-    
-    # Get current time in UTC
-    utc_now = datetime.now(timezone.utc)
-    
-    # Set up timezone for conversions
-    if timezone_offset is not None:
-        local_tz = timezone(timedelta(minutes=timezone_offset))
-        local_now = utc_now.astimezone(local_tz)
-        # Use local time for week calculations (naive datetime in local timezone)
-        today = local_now.replace(tzinfo=None)
+    if detail == "counts":
+        reports = build_weekly_report_counts(db, [user_id], weeks, timezone_offset)[user_id]
     else:
-        # Default to UTC if no timezone offset provided
-        local_tz = None
-        today = utc_now.replace(tzinfo=None)
+        reports = build_weekly_reports(db, [user_id], weeks, timezone_offset, current_user)[user_id]
     
-    for week_offset in range(weeks):
-        # Calculate week range (Monday to Sunday) in local time
-        days_since_monday = today.weekday()
-        week_start_date = today - timedelta(days=days_since_monday + 7 * week_offset)
-        week_start_date = week_start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end_date = week_start_date + timedelta(days=6, hours=23, minutes=59, seconds=59)
-        
-        # Convert week boundaries to UTC for database query
-        if local_tz is not None:
-            # Convert local time boundaries to UTC
-            week_start_utc = week_start_date.replace(tzinfo=local_tz).astimezone(timezone.utc).replace(tzinfo=None)
-            week_end_utc = week_end_date.replace(tzinfo=local_tz).astimezone(timezone.utc).replace(tzinfo=None)
-        else:
-            # Already in UTC
-            week_start_utc = week_start_date
-            week_end_utc = week_end_date
-        
-        # Get posts for this week (using UTC boundaries for database query)
-        week_posts = db.query(Post).filter(
-            Post.user_id == user_id,
-            Post.created_at >= week_start_utc,
-            Post.created_at <= week_end_utc
-        ).all()
-        
-        if week_posts:
-            categories = build_weekly_summary_for_range(week_posts, available_tag_names, db, current_user)
-            if categories:  # Only add if there are categories
-                reports.append(WeeklyReport(
-                    week_start=week_start_date.isoformat(),
-                    week_end=week_end_date.isoformat(),
-                    categories=categories
-                ))
+    return json_response(dumps(reports))
+
+
+@router.get("/{user_id}/weekly-posts", response_model=PostPage)
+async def get_weekly_bucket_posts(
+    user_id: UUID,
+    tag: str = Query(..., description="Category from a weekly summary/report (a tag, or 'other')"),
+    start_date: date = Query(..., description="First local day of the bucket (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="Last local day of the bucket (YYYY-MM-DD)"),
+    timezone_offset: Optional[int] = Query(None, description="Timezone offset in minutes from UTC (e.g., -480 for PST)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    comment_preview: Optional[int] = Query(None, ge=0, le=50, description="Embed only the latest N comments per post"),
+    db: Session = Depends(get_db),
+    current_user: User | None = Depends(get_optional_user)
+):
+    """Get the posts behind one tag/week bucket of a detail=counts summary or report, newest first"""
+    if end_date < start_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end_date must not be before start_date")
     
-    return reports
+    range_start, _ = local_day_bounds_utc(start_date, timezone_offset)
+    _, range_end = local_day_bounds_utc(end_date, timezone_offset)
+    query = db.query(Post).filter(
+        Post.user_id == user_id,
+        Post.created_at >= range_start,
+        Post.created_at < range_end,
+        post_category_expression(db) == tag
+    )
+    try:
+        posts, next_cursor = paginate_keyset(query, Post.created_at, Post.id, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(dumps({
+        "items": hydrate_posts(db, posts, current_user, comment_limit=comment_preview),
+        "next_cursor": next_cursor
+    }))
@@ -1,11 +1,17 @@
 from app.schemas.user import User, UserCreate, UserUpdate, UserInDB
-from app.schemas.post import Post, PostCreate, PostUpdate, PostWithUser
-from app.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentWithUser
-from app.schemas.like import Like, LikeCreate
+from app.schemas.post import Post, PostCreate, PostUpdate, PostWithUser, PostPage
+from app.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentWithUser, CommentPage
+from app.schemas.like import Like, LikeCreate, LikeStatusRequest, LikeStatus
+from app.schemas.tag import TagUsage
+from app.schemas.report import (
+    WeeklySummaryItem, WeeklyReport, UserWeeklyReports, WeeklyReportPage
+)
 
 __all__ = [
     "User", "UserCreate", "UserUpdate", "UserInDB",
-    "Post", "PostCreate", "PostUpdate", "PostWithUser",
-    "Comment", "CommentCreate", "CommentUpdate", "CommentWithUser",
-    "Like", "LikeCreate"
+    "Post", "PostCreate", "PostUpdate", "PostWithUser", "PostPage",
+    "Comment", "CommentCreate", "CommentUpdate", "CommentWithUser", "CommentPage",
+    "Like", "LikeCreate", "LikeStatusRequest", "LikeStatus",
+    "TagUsage",
+    "WeeklySummaryItem", "WeeklyReport", "UserWeeklyReports", "WeeklyReportPage"
 ]
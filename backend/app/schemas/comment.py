@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID
 from app.schemas.user import User
 
@@ -34,3 +34,9 @@ class Comment(CommentBase):
 class CommentWithUser(Comment):
     user: Optional[User] = None
     anonymous_name: Optional[str] = None
+
+
+class CommentPage(BaseModel):
+    items: List[CommentWithUser] = []
+    next_cursor: Optional[str] = None
+    total: int = 0
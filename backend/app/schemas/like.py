@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
 
@@ -18,3 +18,15 @@ class Like(LikeBase):
     
     class Config:
         from_attributes = True
+
+
+MAX_STATUS_POST_IDS = 500
+
+
+class LikeStatusRequest(BaseModel):
+    post_ids: list[UUID] = Field(..., max_length=MAX_STATUS_POST_IDS)
+
+
+class LikeStatus(BaseModel):
+    like_count: int
+    is_liked: bool
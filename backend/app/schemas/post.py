@@ -39,4 +39,10 @@ class PostWithUser(Post):
     tags: Optional[List[str]] = []
     comments: List[CommentWithUser] = []
     like_count: int = 0
+    comment_count: int = 0
     is_liked: bool = False
+
+
+class PostPage(BaseModel):
+    items: List[PostWithUser] = []
+    next_cursor: Optional[str] = None
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from app.schemas.post import PostWithUser
+from app.schemas.user import User
+
+
+class WeeklySummaryItem(BaseModel):
+    tag: str
+    count: int
+    posts: List[PostWithUser] = []
+
+
+class WeeklyReport(BaseModel):
+    week_start: str
+    week_end: str
+    categories: List[WeeklySummaryItem]
+
+
+class UserWeeklyReports(BaseModel):
+    user: User
+    reports: List[WeeklyReport]
+
+
+class WeeklyReportPage(BaseModel):
+    items: List[UserWeeklyReports]
+    next_cursor: Optional[str] = None
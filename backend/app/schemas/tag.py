@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class TagUsage(BaseModel):
+    name: str
+    count: int
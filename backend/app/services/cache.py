@@ -0,0 +1,112 @@
+"""In-process response cache for anonymous reads, invalidated by bump_data_version()."""
+from collections import OrderedDict
+from fastapi import Request
+from fastapi.responses import Response
+from urllib.parse import urlencode
+import threading
+import time
+from app.config import settings
+from app.services.etag import etag_matches, not_modified
+
+
+class ResponseCache:
+    """Thread-safe LRU + TTL cache of serialized responses with version-based invalidation"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[int, float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: str) -> object | None:
+        """Return the cached value for key, or None on a miss"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                version, expires_at, value = entry
+                if version == self.version and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: object, version: int) -> None:
+        """Store value under key if no write happened since version was read"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[key] = (version, time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def bump_version(self) -> None:
+        """Invalidate every entry; called after a write commits"""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "version": self.version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "miss_rate": round(self.misses / lookups, 4) if lookups else 0.0,
+            }
+
+
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl_seconds
+)
+
+
+def bump_data_version() -> None:
+    """Invalidate cached responses after a write that changes post/tag data"""
+    response_cache.bump_version()
+
+
+def cache_key(request: Request) -> str:
+    """Build a cache key from the route path and sorted query params"""
+    params = sorted(request.query_params.multi_items())
+    return f"{request.url.path}?{urlencode(params)}"
+
+
+def json_response(body: bytes, etag: str | None = None) -> Response:
+    """Wrap an already-serialized JSON body in a response"""
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached_response(request: Request, key: str) -> Response | None:
+    """Serve a cached (etag, body) entry for key, answering If-None-Match with 304"""
+    cached = response_cache.get(key)
+    if cached is None:
+        return None
+    etag, body = cached
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return json_response(body, etag)
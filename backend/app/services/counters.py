@@ -0,0 +1,58 @@
+"""Maintenance of the denormalized Post.like_count and Post.comment_count columns."""
+from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from uuid import UUID
+from app.models.post import Post
+from app.models.comment import Comment
+from app.models.like import Like
+
+
+def adjust_like_count_returning(db: Session, post_id: UUID, delta: int) -> int | None:
+    """
+    Atomically add delta to a post's like_count (no commit) and return the new
+    value in the same statement, or None if the post doesn't exist.
+    """
+    return db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(like_count=Post.like_count + delta)
+        .returning(Post.like_count)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+
+
+def adjust_comment_count(db: Session, post_id: UUID, delta: int) -> None:
+    """Atomically add delta to a post's comment_count (no commit)"""
+    db.query(Post).filter(Post.id == post_id).update(
+        {Post.comment_count: Post.comment_count + delta},
+        synchronize_session=False
+    )
+
+
+def recount_posts(db: Session, post_ids: list[UUID]) -> int:
+    """
+    Recompute like_count and comment_count for the given posts from the likes
+    and comments tables. Returns the number of posts whose counters changed.
+    """
+    if not post_ids:
+        return 0
+
+    like_counts = dict(db.query(Like.post_id, func.count(Like.id)).filter(
+        Like.post_id.in_(post_ids)
+    ).group_by(Like.post_id).all())
+    comment_counts = dict(db.query(Comment.post_id, func.count(Comment.id)).filter(
+        Comment.post_id.in_(post_ids)
+    ).group_by(Comment.post_id).all())
+
+    changed = 0
+    rows = db.query(Post.id, Post.like_count, Post.comment_count).filter(Post.id.in_(post_ids)).all()
+    for post_id, like_count, comment_count in rows:
+        new_like_count = like_counts.get(post_id, 0)
+        new_comment_count = comment_counts.get(post_id, 0)
+        if like_count != new_like_count or comment_count != new_comment_count:
+            db.query(Post).filter(Post.id == post_id).update(
+                {Post.like_count: new_like_count, Post.comment_count: new_comment_count},
+                synchronize_session=False
+            )
+            changed += 1
+    return changed
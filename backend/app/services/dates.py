@@ -0,0 +1,41 @@
+"""Helpers for converting client-local calendar ranges into naive UTC bounds."""
+from datetime import datetime, date, timedelta, timezone
+
+
+def local_timezone(timezone_offset: int | None) -> timezone:
+    """Return a fixed-offset tzinfo for timezone_offset, or UTC if not given"""
+    if timezone_offset is None:
+        return timezone.utc
+    return timezone(timedelta(minutes=timezone_offset))
+
+
+def local_to_utc(local_dt: datetime, timezone_offset: int | None) -> datetime:
+    """Convert a naive local datetime into a naive UTC datetime"""
+    return local_dt.replace(tzinfo=local_timezone(timezone_offset)).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def local_day_bounds_utc(day: date, timezone_offset: int | None) -> tuple[datetime, datetime]:
+    """
+    Return the half-open [start, end) naive UTC range covering the local
+    calendar day, suitable for an index range scan on created_at.
+    """
+    local_start = datetime(day.year, day.month, day.day)
+    start = local_to_utc(local_start, timezone_offset)
+    end = local_to_utc(local_start + timedelta(days=1), timezone_offset)
+    return start, end
+
+
+def utc_to_local(utc_dt: datetime, timezone_offset: int | None) -> datetime:
+    """Convert a naive UTC datetime into a naive local datetime"""
+    return utc_dt.replace(tzinfo=timezone.utc).astimezone(local_timezone(timezone_offset)).replace(tzinfo=None)
+
+
+def local_week_start(local_dt: datetime) -> datetime:
+    """Midnight on the Monday of the local week containing local_dt"""
+    monday = local_dt - timedelta(days=local_dt.weekday())
+    return monday.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def current_local_week_start(timezone_offset: int | None) -> datetime:
+    """Start of the current local week (naive local time)"""
+    return local_week_start(utc_to_local(datetime.utcnow(), timezone_offset))
@@ -0,0 +1,50 @@
+"""Streaming NDJSON export of posts."""
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterator
+from uuid import UUID
+from app.models.post import Post
+from app.models.user import User
+from app.services.serialization import dumps, serialize_user
+
+
+def build_export_query(
+    db: Session,
+    user_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None
+):
+    """Posts (with their authors) matching the filters, oldest first; end is exclusive"""
+    query = db.query(Post, User).outerjoin(User, Post.user_id == User.id)
+    if user_id:
+        query = query.filter(Post.user_id == user_id)
+    if start:
+        query = query.filter(Post.created_at >= start)
+    if end:
+        query = query.filter(Post.created_at < end)
+    return query.order_by(Post.created_at, Post.id)
+
+
+def iter_post_export_lines(
+    db: Session,
+    user_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    batch_size: int = 1000
+) -> Iterator[bytes]:
+    """Yield one NDJSON line per post, fetching batch_size rows at a time"""
+    query = build_export_query(db, user_id, start, end).execution_options(stream_results=True)
+    for post, user in query.yield_per(batch_size):
+        yield dumps({
+            "id": post.id,
+            "user_id": post.user_id,
+            "anonymous_name": post.anonymous_name,
+            "content": post.content,
+            "tags": post.tags or [],
+            "created_at": post.created_at,
+            "updated_at": post.updated_at,
+            "is_edited": post.is_edited,
+            "like_count": post.like_count,
+            "comment_count": post.comment_count,
+            "user": serialize_user(user),
+        }) + b"\n"
@@ -0,0 +1,171 @@
+"""Batched hydration of Post rows into PostWithUser-shaped dicts."""
+from sqlalchemy.orm import Session
+from sqlalchemy import func, desc
+from uuid import UUID
+from app.models.post import Post
+from app.models.comment import Comment
+from app.models.like import Like
+from app.models.user import User
+from app.services.serialization import serialize_post, serialize_comment
+from app.services.like_buffer import like_buffer
+from app.services.liked_cache import liked_posts_cache
+
+
+def load_users(db: Session, user_ids: set[UUID]) -> dict[UUID, User]:
+    """Load users by id in a single query"""
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return {}
+    users = db.query(User).filter(User.id.in_(user_ids)).all()
+    return {user.id: user for user in users}
+
+
+def load_comments(db: Session, post_ids: list[UUID], limit: int | None = None) -> dict[UUID, list[Comment]]:
+    """
+    Load comments for many posts in a single query, oldest first.
+
+    If limit is given, only the latest `limit` comments of each post are loaded
+    (ranked with a window function), so one busy thread cannot inflate a page.
+    """
+    comments_by_post: dict[UUID, list[Comment]] = {post_id: [] for post_id in post_ids}
+    if not post_ids or limit == 0:
+        return comments_by_post
+    query = db.query(Comment).filter(Comment.post_id.in_(post_ids))
+    if limit is not None:
+        rank = func.row_number().over(
+            partition_by=Comment.post_id,
+            order_by=(desc(Comment.created_at), desc(Comment.id))
+        ).label("rank")
+        ranked = db.query(Comment.id.label("id"), rank).filter(
+            Comment.post_id.in_(post_ids)
+        ).subquery()
+        query = db.query(Comment).join(ranked, Comment.id == ranked.c.id).filter(ranked.c.rank <= limit)
+    comments = query.order_by(Comment.created_at, Comment.id).all()
+    for comment in comments:
+        comments_by_post[comment.post_id].append(comment)
+    return comments_by_post
+
+
+def load_liked_post_ids(db: Session, post_ids: list[UUID], current_user: User | None) -> set[UUID]:
+    """
+    Return the subset of post_ids liked by current_user, from the per-user
+    liked posts cache or, for uncacheable users, in a single query
+    """
+    if not current_user or not post_ids:
+        return set()
+    liked = liked_posts_cache.liked_post_ids(db, current_user.id)
+    if liked is not None:
+        return {post_id for post_id in post_ids if post_id in liked}
+    rows = db.query(Like.post_id).filter(
+        Like.user_id == current_user.id,
+        Like.post_id.in_(post_ids)
+    ).all()
+    return {row[0] for row in rows}
+
+
+def build_comment(comment: Comment, users: dict[UUID, User]) -> dict:
+    """Build a CommentWithUser dict from a Comment row and preloaded users"""
+    return serialize_comment(comment, users.get(comment.user_id) if comment.user_id else None)
+
+
+class PostContext:
+    """Rows loaded for a list of posts, before any response objects are built"""
+
+    def __init__(
+        self,
+        posts: list[Post],
+        comments_by_post: dict[UUID, list[Comment]],
+        users: dict[UUID, User],
+        liked_post_ids: set[UUID],
+        like_deltas: dict[UUID, int] | None = None
+    ):
+        self.posts = posts
+        self.comments_by_post = comments_by_post
+        self.users = users
+        self.liked_post_ids = liked_post_ids
+        # Unflushed like_count changes from the like buffer, by post id
+        self.like_deltas = like_deltas or {}
+
+    def fingerprint(self) -> tuple:
+        """
+        Every field that can change the serialized posts: post and comment
+        versions, stored counters, embedded author profiles and the viewer's
+        likes. Used to derive ETags without building the response.
+        """
+        return (
+            tuple(
+                (post.id, post.created_at, post.updated_at, post.like_count, post.comment_count)
+                for post in self.posts
+            ),
+            tuple(
+                (comment.id, comment.updated_at)
+                for post in self.posts
+                for comment in self.comments_by_post[post.id]
+            ),
+            tuple(sorted(
+                (user.id, user.name, user.email, user.avatar_url, user.bio, user.last_login)
+                for user in self.users.values()
+            )),
+            tuple(sorted(self.liked_post_ids)),
+            tuple(sorted(self.like_deltas.items())),
+        )
+
+
+def load_post_context(
+    db: Session,
+    posts: list[Post],
+    current_user: User | None,
+    comment_limit: int | None = None
+) -> PostContext:
+    """
+    Load everything needed to render posts, preserving their order.
+
+    Issues at most three queries regardless of how many posts are passed:
+    comments, users (post and comment authors) and the viewer's likes.
+    comment_limit embeds only the latest N comments per post; the full total
+    is always available as comment_count.
+    """
+    post_ids = [post.id for post in posts]
+    comments_by_post = load_comments(db, post_ids, comment_limit)
+
+    author_ids = {post.user_id for post in posts}
+    for comments in comments_by_post.values():
+        author_ids.update(comment.user_id for comment in comments)
+    users = load_users(db, author_ids)
+
+    liked_post_ids, like_deltas = like_buffer.overlay(
+        post_ids,
+        current_user.id if current_user else None,
+        load_liked_post_ids(db, post_ids, current_user)
+    )
+    return PostContext(posts, comments_by_post, users, liked_post_ids, like_deltas)
+
+
+def build_posts(context: PostContext) -> list[dict]:
+    """Build PostWithUser dicts from a loaded PostContext"""
+    users = context.users
+    result = []
+    for post in context.posts:
+        post_dict = serialize_post(
+            post,
+            users.get(post.user_id) if post.user_id else None,
+            [build_comment(comment, users) for comment in context.comments_by_post[post.id]],
+            post.id in context.liked_post_ids
+        )
+        if post.id in context.like_deltas:
+            post_dict["like_count"] = max(post_dict["like_count"] + context.like_deltas[post.id], 0)
+        result.append(post_dict)
+    return result
+
+
+def hydrate_posts(
+    db: Session,
+    posts: list[Post],
+    current_user: User | None,
+    comment_limit: int | None = None
+) -> list[dict]:
+    """Load and build PostWithUser dicts for a list of posts in a fixed number of queries"""
+    if not posts:
+        return []
+    return build_posts(load_post_context(db, posts, current_user, comment_limit))
+
@@ -0,0 +1,328 @@
+"""Optional write-behind buffering of like/unlike intents for hot posts."""
+from collections import Counter, deque
+from sqlalchemy.orm import Session
+from sqlalchemy import select, exists, delete, update, tuple_, bindparam
+from datetime import datetime
+from uuid import UUID, uuid4
+import logging
+import threading
+import time
+from app.config import settings
+from app.database import SessionLocal
+from app.models.like import Like
+from app.models.post import Post
+from app.services.cache import bump_data_version
+from app.services.upsert import insert_ignore
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT/DELETE statement, well under SQLite's bound parameter limit
+FLUSH_CHUNK_SIZE = 500
+# Recent flushes kept for latency and batch size percentiles
+METRICS_WINDOW = 256
+
+
+class PendingLikes:
+    """Intended like states per (post, user), with their stored baseline"""
+
+    def __init__(self):
+        # post_id -> user_id -> (stored_liked, desired_liked)
+        self.entries: dict[UUID, dict[UUID, tuple[bool, bool]]] = {}
+        # post_id -> pending like_count delta
+        self.deltas: dict[UUID, int] = {}
+        self.size = 0
+
+    def get(self, post_id: UUID, user_id: UUID) -> tuple[bool, bool] | None:
+        return self.entries.get(post_id, {}).get(user_id)
+
+    def set(self, post_id: UUID, user_id: UUID, stored: bool, desired: bool) -> None:
+        users = self.entries.setdefault(post_id, {})
+        previous = users.pop(user_id, None)
+        delta = self.deltas.get(post_id, 0)
+        if previous is not None:
+            delta -= int(previous[1]) - int(previous[0])
+            self.size -= 1
+        if stored != desired:
+            users[user_id] = (stored, desired)
+            delta += int(desired) - int(stored)
+            self.size += 1
+        if users:
+            self.deltas[post_id] = delta
+        else:
+            del self.entries[post_id]
+            self.deltas.pop(post_id, None)
+
+
+class LikeBuffer:
+    """Thread-safe write-behind buffer of like intents with a background flusher"""
+
+    def __init__(self, enabled: bool, flush_ms: int, max_events: int, session_factory=SessionLocal):
+        self.enabled = enabled
+        self.flush_seconds = flush_ms / 1000
+        self.max_events = max_events
+        self.session_factory = session_factory
+        self._pending = PendingLikes()
+        # Batch being written by the current flush; still overlaid until it commits
+        self._flushing: PendingLikes | None = None
+        # Odd while a flush is committing, incremented again once its batch
+        # has been dropped from the overlay
+        self._flush_generation = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.events = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.rows_written = 0
+        self._latencies_ms: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._batch_sizes: deque[int] = deque(maxlen=METRICS_WINDOW)
+
+    def _current_intent(self, post_id: UUID, user_id: UUID) -> tuple[bool, bool] | None:
+        """(baseline, desired) from the pending batch, else from the batch being flushed (lock held)"""
+        entry = self._pending.get(post_id, user_id)
+        if entry is None and self._flushing is not None:
+            flushing = self._flushing.get(post_id, user_id)
+            if flushing is not None:
+                # Once the flush commits the stored state is its desired state
+                entry = (flushing[1], flushing[1])
+        return entry
+
+    def toggle(self, db: Session, post_id: UUID, user_id: UUID) -> tuple[bool, int] | None:
+        """
+        Record a toggle of user_id's like on post_id. Returns (liked, like_count)
+        including pending intents, or None if the post doesn't exist.
+        """
+        while True:
+            with self._lock:
+                generation = self._flush_generation
+            if generation % 2:
+                # Wait out the commit instead of reading half-applied state
+                with self._flush_lock:
+                    continue
+            row = db.execute(
+                select(
+                    Post.like_count,
+                    exists().where(Like.post_id == post_id, Like.user_id == user_id)
+                ).where(Post.id == post_id)
+            ).first()
+            if row is None:
+                return None
+            stored_count, stored_liked = row
+
+            with self._lock:
+                # A flush that committed around the read made it stale: the
+                # stored state no longer matches the remaining overlay
+                if generation != self._flush_generation:
+                    continue
+                entry = self._current_intent(post_id, user_id)
+                baseline, current = entry if entry is not None else (stored_liked, stored_liked)
+                self._pending.set(post_id, user_id, baseline, not current)
+                self.events += 1
+                like_count = stored_count + self._pending_delta(post_id)
+                should_flush = self._pending.size >= self.max_events
+                break
+        if should_flush:
+            self._wakeup.set()
+        return not current, max(like_count, 0)
+
+    def _pending_delta(self, post_id: UUID) -> int:
+        """like_count delta of unflushed intents on post_id (lock held)"""
+        delta = self._pending.deltas.get(post_id, 0)
+        if self._flushing is not None:
+            delta += self._flushing.deltas.get(post_id, 0)
+        return delta
+
+    def pending_delta(self, post_id: UUID) -> int:
+        """like_count change of intents on post_id not yet flushed"""
+        if not self.enabled:
+            return 0
+        with self._lock:
+            return self._pending_delta(post_id)
+
+    def overlay(self, post_ids: list[UUID], user_id: UUID | None, liked_post_ids: set[UUID]) -> tuple[set[UUID], dict[UUID, int]]:
+        """
+        Apply pending intents to a page of posts: returns the viewer's liked
+        post ids and like_count deltas by post id (only non-zero entries).
+        """
+        if not self.enabled:
+            return liked_post_ids, {}
+        with self._lock:
+            if not self._pending.size and self._flushing is None:
+                return liked_post_ids, {}
+            deltas = {}
+            liked = set(liked_post_ids)
+            for post_id in post_ids:
+                delta = self._pending_delta(post_id)
+                if delta:
+                    deltas[post_id] = delta
+                if user_id is not None:
+                    entry = self._current_intent(post_id, user_id)
+                    if entry is not None:
+                        if entry[1]:
+                            liked.add(post_id)
+                        else:
+                            liked.discard(post_id)
+            return liked, deltas
+
+    def flush(self) -> int:
+        """Write pending intents in one transaction; returns the number of intents flushed"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending.size:
+                    return 0
+                batch, self._pending = self._pending, PendingLikes()
+                self._flushing = batch
+
+            started = time.perf_counter()
+            db = self.session_factory()
+            try:
+                rows = self._write_batch(db, batch)
+                # Toggles reading while the commit runs outside the lock re-read
+                with self._lock:
+                    self._flush_generation += 1
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Like buffer flush of {batch.size} intents failed: {type(e).__name__} - {str(e)}", exc_info=True)
+                with self._lock:
+                    self._restore(batch)
+                    self._flushing = None
+                    if self._flush_generation % 2:
+                        self._flush_generation += 1
+                    self.failed_flushes += 1
+                return 0
+            finally:
+                db.close()
+
+            with self._lock:
+                self._flushing = None
+                self._flush_generation += 1
+                self.flushes += 1
+                self.rows_written += rows
+                self._latencies_ms.append((time.perf_counter() - started) * 1000)
+                self._batch_sizes.append(batch.size)
+
+            bump_data_version()
+            return batch.size
+
+    def _write_batch(self, db: Session, batch: PendingLikes) -> int:
+        """Apply a batch's like rows and counter deltas (no commit); returns rows changed"""
+        likes = Like.__table__
+        existing_post_ids = set()
+        post_ids = list(batch.entries)
+        for start in range(0, len(post_ids), FLUSH_CHUNK_SIZE):
+            chunk = post_ids[start:start + FLUSH_CHUNK_SIZE]
+            existing_post_ids.update(row[0] for row in db.execute(select(Post.id).where(Post.id.in_(chunk))))
+
+        now = datetime.utcnow()
+        to_insert = []
+        to_delete = []
+        for post_id, users in batch.entries.items():
+            # Intents for posts deleted since the click are dropped
+            if post_id not in existing_post_ids:
+                continue
+            for user_id, (_, desired) in users.items():
+                if desired:
+                    to_insert.append({"id": uuid4(), "post_id": post_id, "user_id": user_id, "created_at": now})
+                else:
+                    to_delete.append((post_id, user_id))
+
+        # Counters move only by rows actually inserted or deleted
+        deltas: Counter[UUID] = Counter()
+        for start in range(0, len(to_insert), FLUSH_CHUNK_SIZE):
+            result = db.execute(
+                insert_ignore(db, likes).values(to_insert[start:start + FLUSH_CHUNK_SIZE]).returning(likes.c.post_id)
+            )
+            deltas.update(row[0] for row in result)
+        for start in range(0, len(to_delete), FLUSH_CHUNK_SIZE):
+            result = db.execute(
+                delete(likes)
+                .where(tuple_(likes.c.post_id, likes.c.user_id).in_(to_delete[start:start + FLUSH_CHUNK_SIZE]))
+                .returning(likes.c.post_id)
+            )
+            deltas.subtract(row[0] for row in result)
+
+        changes = [{"target_id": post_id, "delta": delta} for post_id, delta in deltas.items() if delta]
+        if changes:
+            posts = Post.__table__
+            db.execute(
+                update(posts)
+                .where(posts.c.id == bindparam("target_id"))
+                .values(like_count=posts.c.like_count + bindparam("delta")),
+                changes
+            )
+        return sum(abs(change["delta"]) for change in changes)
+
+    def _restore(self, batch: PendingLikes) -> None:
+        """Merge a failed batch back under intents recorded since (lock held)"""
+        for post_id, users in batch.entries.items():
+            for user_id, (stored, desired) in users.items():
+                newer = self._pending.get(post_id, user_id)
+                if newer is None:
+                    self._pending.set(post_id, user_id, stored, desired)
+                else:
+                    # The newer intent assumed this batch would commit
+                    self._pending.set(post_id, user_id, stored, newer[1])
+
+    def start(self) -> None:
+        """Start the background flusher (no-op when disabled)"""
+        if not self.enabled or self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="like-buffer-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher and write whatever is still pending"""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Like buffer flusher error: {type(e).__name__} - {str(e)}", exc_info=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            batch_sizes = sorted(self._batch_sizes)
+            return {
+                "enabled": self.enabled,
+                "flush_ms": round(self.flush_seconds * 1000),
+                "max_events": self.max_events,
+                "pending": self._pending.size,
+                "events": self.events,
+                "flushes": self.flushes,
+                "failed_flushes": self.failed_flushes,
+                "rows_written": self.rows_written,
+                "flush_latency_ms": _summary(latencies),
+                "batch_size": _summary(batch_sizes),
+            }
+
+
+def _summary(sorted_values: list) -> dict:
+    """last-window p50/p95/max of a sorted sample"""
+    if not sorted_values:
+        return {"p50": 0, "p95": 0, "max": 0}
+    return {
+        "p50": round(sorted_values[len(sorted_values) // 2], 2),
+        "p95": round(sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * 0.95))], 2),
+        "max": round(sorted_values[-1], 2),
+    }
+
+
+like_buffer = LikeBuffer(
+    enabled=settings.like_buffer_enabled,
+    flush_ms=settings.like_buffer_flush_ms,
+    max_events=settings.like_buffer_max_events,
+)
@@ -0,0 +1,138 @@
+"""Per-user cache of liked post ids for is_liked hydration."""
+from collections import OrderedDict
+from sqlalchemy.orm import Session
+from uuid import UUID
+import sys
+import threading
+import time
+from app.config import settings
+from app.models.like import Like
+
+# Approximate size of one cached UUID (object plus its int) and set slot
+BYTES_PER_ID = sys.getsizeof(UUID(int=0)) + sys.getsizeof(2 ** 127) + 16
+
+
+class LikedPostsCache:
+    """Thread-safe LRU + TTL cache of user_id -> frozenset of liked post ids"""
+
+    def __init__(self, max_users: int, max_ids: int, max_ids_per_user: int, ttl_seconds: float):
+        self.max_users = max_users
+        self.max_ids = max_ids
+        self.max_ids_per_user = max_ids_per_user
+        self.ttl_seconds = ttl_seconds
+        # user_id -> (expires_at, liked post ids, or None if over the per-user limit)
+        self._entries: OrderedDict[UUID, tuple[float, frozenset[UUID] | None]] = OrderedDict()
+        self._ids = 0
+        # Sequence of the latest write per recently written user, so a load
+        # that raced a toggle is not stored
+        self._sequence = 0
+        self._last_writes: OrderedDict[UUID, int] = OrderedDict()
+        self._oldest_write_dropped = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_users > 0 and self.max_ids > 0
+
+    def liked_post_ids(self, db: Session, user_id: UUID) -> frozenset[UUID] | None:
+        """
+        All post ids liked by user_id, loading them with one query on a miss.
+        Returns None when the user has too many likes to cache.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            sequence = self._sequence
+
+        rows = db.query(Like.post_id).filter(Like.user_id == user_id).limit(self.max_ids_per_user + 1).all()
+        liked = frozenset(row[0] for row in rows) if len(rows) <= self.max_ids_per_user else None
+
+        with self._lock:
+            if liked is None:
+                self.uncacheable += 1
+            if self._written_since(user_id, sequence):
+                return liked
+            self._store(user_id, liked)
+        return liked
+
+    def update(self, user_id: UUID, post_id: UUID, liked: bool) -> None:
+        """Apply a committed like or unlike to the user's cached set"""
+        with self._lock:
+            self._sequence += 1
+            self._last_writes[user_id] = self._sequence
+            self._last_writes.move_to_end(user_id)
+            while len(self._last_writes) > max(self.max_users, 1) * 4:
+                _, dropped = self._last_writes.popitem(last=False)
+                self._oldest_write_dropped = dropped
+
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] is None:
+                return
+            expires_at, post_ids = entry
+            post_ids = post_ids | {post_id} if liked else post_ids - {post_id}
+            if len(post_ids) > self.max_ids_per_user:
+                self._drop(user_id)
+                return
+            self._ids += len(post_ids) - len(entry[1])
+            self._entries[user_id] = (expires_at, post_ids)
+            self._evict()
+
+    def _written_since(self, user_id: UUID, sequence: int) -> bool:
+        """Whether user_id may have been written after sequence was read (lock held)"""
+        if sequence < self._oldest_write_dropped:
+            return True
+        return self._last_writes.get(user_id, 0) > sequence
+
+    def _store(self, user_id: UUID, liked: frozenset[UUID] | None) -> None:
+        self._drop(user_id)
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, liked)
+        self._ids += len(liked or ())
+        self._evict()
+
+    def _drop(self, user_id: UUID) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self._ids -= len(entry[1] or ())
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_users or self._ids > self.max_ids):
+            _, (_, liked) = self._entries.popitem(last=False)
+            self._ids -= len(liked or ())
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            set_bytes = sum(sys.getsizeof(liked) for _, liked in self._entries.values() if liked is not None)
+            return {
+                "enabled": self.enabled,
+                "users": len(self._entries),
+                "max_users": self.max_users,
+                "ids": self._ids,
+                "max_ids": self.max_ids,
+                "max_ids_per_user": self.max_ids_per_user,
+                "approx_bytes": set_bytes + self._ids * BYTES_PER_ID,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+liked_posts_cache = LikedPostsCache(
+    max_users=settings.liked_posts_cache_max_users,
+    max_ids=settings.liked_posts_cache_max_ids,
+    max_ids_per_user=settings.liked_posts_cache_max_ids_per_user,
+    ttl_seconds=settings.liked_posts_cache_ttl_seconds,
+)
@@ -0,0 +1,44 @@
+"""Race-free like toggling with DELETE/INSERT ... RETURNING."""
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, exists, literal
+from datetime import datetime
+from uuid import UUID, uuid4
+from app.models.like import Like
+from app.models.post import Post
+from app.models.uuid_type import GUID
+from app.services.counters import adjust_like_count_returning
+from app.services.upsert import dialect_insert
+
+
+def toggle_post_like(db: Session, post_id: UUID, user_id: UUID) -> tuple[bool, int] | None:
+    """
+    Toggle user_id's like on post_id (no commit). Returns (liked, like_count)
+    as of this transaction, or None if the post doesn't exist.
+    """
+    deleted = db.execute(
+        delete(Like)
+        .where(Like.post_id == post_id, Like.user_id == user_id)
+        .returning(Like.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if deleted is not None:
+        liked, delta = False, -1
+    else:
+        values = select(
+            literal(uuid4(), GUID()),
+            literal(post_id, GUID()),
+            literal(user_id, GUID()),
+            literal(datetime.utcnow())
+        ).where(exists().where(Post.id == post_id))
+        inserted = db.execute(
+            dialect_insert(db, Like.__table__)
+            .from_select(["id", "post_id", "user_id", "created_at"], values)
+            .on_conflict_do_nothing(index_elements=["post_id", "user_id"])
+            .returning(Like.__table__.c.id)
+        ).first()
+        liked, delta = True, 1 if inserted is not None else 0
+
+    like_count = adjust_like_count_returning(db, post_id, delta)
+    if like_count is None:
+        return None
+    return liked, like_count
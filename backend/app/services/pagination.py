@@ -0,0 +1,61 @@
+"""Keyset (cursor) pagination over (created_at, id)."""
+from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy.orm import Query
+from datetime import datetime
+from uuid import UUID
+import base64
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode a (created_at, id) sort key as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor. Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def paginate_keyset(
+    query: Query,
+    created_at_column,
+    id_column,
+    cursor: str | None,
+    limit: int,
+    newest_first: bool = True
+) -> tuple[list, str | None]:
+    """
+    Apply keyset pagination to query and return (rows, next_cursor).
+
+    Rows are ordered by (created_at_column, id_column), newest first by default.
+    next_cursor is None when there are no more rows.
+    """
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        if newest_first:
+            query = query.filter(or_(
+                created_at_column < cursor_created_at,
+                and_(created_at_column == cursor_created_at, id_column < cursor_id)
+            ))
+        else:
+            query = query.filter(or_(
+                created_at_column > cursor_created_at,
+                and_(created_at_column == cursor_created_at, id_column > cursor_id)
+            ))
+
+    order = desc if newest_first else asc
+    rows = query.order_by(order(created_at_column), order(id_column)).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, created_at_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
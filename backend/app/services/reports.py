@@ -0,0 +1,269 @@
+"""Weekly report building shared by the per-user and site-wide report endpoints."""
+from sqlalchemy.orm import Session
+from sqlalchemy import func, cast
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime, timedelta
+from uuid import UUID
+from app.models.post import Post
+from app.models.user import User
+from app.models.weekly_tag_count import WeeklyTagCount
+from app.services.dates import local_to_utc, utc_to_local, local_week_start, current_local_week_start
+from app.services.hydration import hydrate_posts
+from app.services.tags import tag_registry
+from app.services.rollup import OTHER_CATEGORY
+from app.services.week_cache import week_report_cache
+
+
+def week_end_label(week_start: datetime) -> str:
+    """ISO timestamp of the last second of the week starting at week_start"""
+    return (week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)).isoformat()
+
+
+def group_post_ids_by_tag(
+    posts: list[Post],
+    available_tag_names: frozenset[str]
+) -> list[tuple[str, list[UUID]]]:
+    """
+    Group posts into ordered (tag, post_ids) categories: one per known tag (a
+    post counts under its first known tag) plus "other", largest first.
+    """
+    tag_posts: dict[str, list[UUID]] = {}
+    other_posts: list[UUID] = []
+    processed_posts = set()
+    
+    for post in posts:
+        tags = post.tags or []
+        
+        if tags:
+            has_valid_tag = False
+            for tag in tags:
+                if tag in available_tag_names:
+                    has_valid_tag = True
+                    if post.id not in processed_posts:
+                        tag_posts.setdefault(tag, []).append(post.id)
+                        processed_posts.add(post.id)
+            
+            if not has_valid_tag and post.id not in processed_posts:
+                other_posts.append(post.id)
+                processed_posts.add(post.id)
+        else:
+            if post.id not in processed_posts:
+                other_posts.append(post.id)
+                processed_posts.add(post.id)
+    
+    # Tagged categories sorted by tag name, then "other"
+    result = [(tag_name, tag_posts[tag_name]) for tag_name in sorted(tag_posts.keys())]
+    if other_posts:
+        result.append((OTHER_CATEGORY, other_posts))
+    
+    result.sort(key=lambda category: len(category[1]), reverse=True)
+    return result
+
+
+def build_categories(buckets: list[tuple[str, list[UUID]]], hydrated: dict[UUID, dict]) -> list[dict]:
+    """WeeklySummaryItem dicts from (tag, post_ids) categories and hydrated posts"""
+    return [
+        {"tag": tag, "count": len(post_ids), "posts": [hydrated[post_id] for post_id in post_ids]}
+        for tag, post_ids in buckets
+    ]
+
+
+def group_posts_by_tag(
+    posts: list[Post],
+    available_tag_names: frozenset[str],
+    hydrated: dict[UUID, dict]
+) -> list[dict]:
+    """Group already-hydrated posts into WeeklySummaryItem dicts"""
+    return build_categories(group_post_ids_by_tag(posts, available_tag_names), hydrated)
+
+
+def build_weekly_reports(
+    db: Session,
+    user_ids: list[UUID],
+    weeks: int,
+    timezone_offset: int | None,
+    current_user: User | None
+) -> dict[UUID, list[dict]]:
+    """
+    WeeklyReport dicts for the last `weeks` local weeks (Monday to Sunday),
+    newest first, for each of user_ids. Weeks without posts are omitted.
+    
+    Completed weeks come from week_report_cache when possible; only the
+    current week and uncached weeks are read with the range query.
+    """
+    reports: dict[UUID, list[dict]] = {user_id: [] for user_id in user_ids}
+    if not user_ids:
+        return reports
+    
+    cache_version = week_report_cache.version
+    current_week_start = current_local_week_start(timezone_offset)
+    week_starts = [current_week_start - timedelta(weeks=week_offset) for week_offset in range(weeks)]
+    
+    # Completed weeks: cached (tag, post_ids) groupings per (user, week)
+    cached: dict[tuple[UUID, datetime], list[tuple[str, list[UUID]]]] = {}
+    oldest_uncached = current_week_start
+    for user_id in user_ids:
+        for week_start in week_starts[1:]:
+            buckets = week_report_cache.get((user_id, week_start, timezone_offset))
+            if buckets is None:
+                oldest_uncached = min(oldest_uncached, week_start)
+            else:
+                cached[(user_id, week_start)] = buckets
+    
+    # One range query from the oldest uncached week (served by the (user_id,
+    # created_at) index), bucketed by user and local week in memory
+    posts = db.query(Post).filter(
+        Post.user_id.in_(user_ids),
+        Post.created_at >= local_to_utc(oldest_uncached, timezone_offset),
+        Post.created_at < local_to_utc(current_week_start + timedelta(weeks=1), timezone_offset)
+    ).order_by(Post.created_at, Post.id).all()
+    
+    week_posts: dict[tuple[UUID, datetime], list[Post]] = {}
+    for post in posts:
+        week_start = local_week_start(utc_to_local(post.created_at, timezone_offset))
+        week_posts.setdefault((post.user_id, week_start), []).append(post)
+    
+    # Known tag names come from the in-memory registry
+    available_tag_names = tag_registry.names(db)
+    groupings: dict[tuple[UUID, datetime], list[tuple[str, list[UUID]]]] = {}
+    for user_id in user_ids:
+        for week_start in week_starts:
+            key = (user_id, week_start)
+            if key in cached:
+                groupings[key] = cached[key]
+                continue
+            groupings[key] = group_post_ids_by_tag(week_posts.get(key, []), available_tag_names)
+            if week_start != current_week_start:
+                week_report_cache.set(
+                    (user_id, week_start, timezone_offset),
+                    local_to_utc(week_start, timezone_offset),
+                    local_to_utc(week_start + timedelta(weeks=1), timezone_offset),
+                    groupings[key],
+                    cache_version
+                )
+    
+    # Posts of cached weeks are loaded by primary key; everything is
+    # hydrated in one batch
+    loaded_ids = {post.id for post in posts}
+    missing_ids = [
+        post_id
+        for buckets in cached.values()
+        for _, post_ids in buckets
+        for post_id in post_ids
+        if post_id not in loaded_ids
+    ]
+    if missing_ids:
+        posts = posts + db.query(Post).filter(Post.id.in_(missing_ids)).all()
+    hydrated = {post["id"]: post for post in hydrate_posts(db, posts, current_user)}
+    
+    for user_id in user_ids:
+        for week_start in week_starts:
+            # A cached post may have been deleted by a concurrent write
+            buckets = [
+                (tag, live_ids)
+                for tag, post_ids in groupings[(user_id, week_start)]
+                if (live_ids := [post_id for post_id in post_ids if post_id in hydrated])
+            ]
+            if buckets:
+                reports[user_id].append({
+                    "week_start": week_start.isoformat(),
+                    "week_end": week_end_label(week_start),
+                    "categories": build_categories(buckets, hydrated)
+                })
+    return reports
+
+
+def post_category_expression(db: Session):
+    """SQL for the category a post counts under: its first tag, or "other" """
+    if db.get_bind().dialect.name == "postgresql":
+        first_tag = cast(Post.tags, JSONB)[0].astext
+    else:
+        first_tag = func.json_extract(Post.tags, "$[0]")
+    return func.coalesce(first_tag, OTHER_CATEGORY)
+
+
+def local_date_expression(db: Session, timezone_offset: int | None):
+    """SQL for the viewer's local calendar date of Post.created_at"""
+    minutes = timezone_offset or 0
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date(Post.created_at + func.make_interval(0, 0, 0, 0, 0, minutes))
+    return func.date(Post.created_at, f"{minutes:+d} minutes")
+
+
+def order_categories(counts: dict[str, int]) -> list[dict]:
+    """
+    Count-only WeeklySummaryItem dicts in the same order group_posts_by_tag
+    produces: by count descending, ties by tag name with "other" last.
+    """
+    tags = sorted(tag for tag in counts if tag != OTHER_CATEGORY)
+    if OTHER_CATEGORY in counts:
+        tags.append(OTHER_CATEGORY)
+    result = [{"tag": tag, "count": counts[tag], "posts": []} for tag in tags]
+    result.sort(key=lambda x: x["count"], reverse=True)
+    return result
+
+
+def count_posts_by_category(db: Session, user_id: UUID, start: datetime, end: datetime) -> list[dict]:
+    """Count-only weekly summary for one user and a naive UTC range [start, end]"""
+    category = post_category_expression(db)
+    rows = db.query(category, func.count()).filter(
+        Post.user_id == user_id,
+        Post.created_at >= start,
+        Post.created_at <= end
+    ).group_by(category).all()
+    return order_categories(dict(rows))
+
+
+def build_weekly_report_counts(
+    db: Session,
+    user_ids: list[UUID],
+    weeks: int,
+    timezone_offset: int | None
+) -> dict[UUID, list[dict]]:
+    """
+    Count-only version of build_weekly_reports: no posts are loaded. UTC weeks
+    are read from the weekly_tag_counts rollup; other offsets use one GROUP BY
+    over (user, local day, category), folded into local weeks in memory.
+    """
+    reports: dict[UUID, list[dict]] = {user_id: [] for user_id in user_ids}
+    if not user_ids:
+        return reports
+    
+    current_week_start = current_local_week_start(timezone_offset)
+    oldest_week_start = current_week_start - timedelta(weeks=weeks - 1)
+    counts: dict[tuple[UUID, datetime], dict[str, int]] = {}
+    
+    if not timezone_offset:
+        # UTC weeks line up with the rollup buckets
+        rows = db.query(WeeklyTagCount).filter(
+            WeeklyTagCount.user_id.in_(user_ids),
+            WeeklyTagCount.week_start >= oldest_week_start,
+            WeeklyTagCount.week_start <= current_week_start,
+            WeeklyTagCount.count > 0
+        ).all()
+        for row in rows:
+            counts.setdefault((row.user_id, row.week_start), {})[row.tag] = row.count
+    else:
+        local_day = local_date_expression(db, timezone_offset)
+        category = post_category_expression(db)
+        rows = db.query(Post.user_id, local_day, category, func.count()).filter(
+            Post.user_id.in_(user_ids),
+            Post.created_at >= local_to_utc(oldest_week_start, timezone_offset),
+            Post.created_at < local_to_utc(current_week_start + timedelta(weeks=1), timezone_offset)
+        ).group_by(Post.user_id, local_day, category).all()
+        for user_id, day, tag, count in rows:
+            week_start = local_week_start(datetime.fromisoformat(str(day)))
+            week_counts = counts.setdefault((user_id, week_start), {})
+            week_counts[tag] = week_counts.get(tag, 0) + count
+    
+    for user_id in user_ids:
+        for week_offset in range(weeks):
+            week_start_date = current_week_start - timedelta(weeks=week_offset)
+            week_counts = counts.get((user_id, week_start_date))
+            if week_counts:
+                reports[user_id].append({
+                    "week_start": week_start_date.isoformat(),
+                    "week_end": week_end_label(week_start_date),
+                    "categories": order_categories(week_counts)
+                })
+    return reports
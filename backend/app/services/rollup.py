@@ -0,0 +1,74 @@
+"""Materialized weekly tag rollup: (user_id, week_start, tag) -> post count."""
+from sqlalchemy.orm import Session
+from datetime import datetime
+from uuid import UUID
+from app.models.post import Post
+from app.models.weekly_tag_count import WeeklyTagCount
+from app.services.dates import local_week_start
+from app.services.upsert import insert_or_increment
+
+OTHER_CATEGORY = "other"
+
+
+def rollup_week_start(created_at: datetime) -> datetime:
+    """Monday 00:00 UTC of the week containing a naive UTC timestamp"""
+    return local_week_start(created_at)
+
+
+def rollup_category(tags: list[str] | None) -> str:
+    """Category a post counts under: its first tag, or "other" """
+    return tags[0] if tags else OTHER_CATEGORY
+
+
+def adjust_weekly_tag_count(
+    db: Session,
+    user_id: UUID | None,
+    created_at: datetime,
+    tags: list[str] | None,
+    delta: int
+) -> None:
+    """Add delta to the rollup bucket of a post (no commit)"""
+    if user_id is None:
+        return
+    week_start = rollup_week_start(created_at)
+    category = rollup_category(tags)
+    table = WeeklyTagCount.__table__
+    db.execute(insert_or_increment(
+        db,
+        table,
+        {"user_id": user_id, "week_start": week_start, "tag": category, "count": delta},
+        ["user_id", "week_start", "tag"],
+        "count"
+    ))
+    if delta < 0:
+        # Drop emptied buckets so the table only holds weeks with posts
+        db.query(WeeklyTagCount).filter(
+            WeeklyTagCount.user_id == user_id,
+            WeeklyTagCount.week_start == week_start,
+            WeeklyTagCount.tag == category,
+            WeeklyTagCount.count <= 0
+        ).delete(synchronize_session=False)
+
+
+def rebuild_weekly_tag_counts(db: Session, batch_size: int = 1000) -> int:
+    """
+    Recompute the whole rollup from posts in one transaction (no commit).
+    Posts are streamed in batches; returns the number of buckets written.
+    """
+    counts: dict[tuple[UUID, datetime, str], int] = {}
+    rows = db.query(Post.user_id, Post.created_at, Post.tags).filter(
+        Post.user_id.isnot(None)
+    ).execution_options(stream_results=True).yield_per(batch_size)
+    for user_id, created_at, tags in rows:
+        key = (user_id, rollup_week_start(created_at), rollup_category(tags))
+        counts[key] = counts.get(key, 0) + 1
+    
+    db.query(WeeklyTagCount).delete(synchronize_session=False)
+    buckets = [
+        {"user_id": user_id, "week_start": week_start, "tag": tag, "count": count}
+        for (user_id, week_start, tag), count in counts.items()
+    ]
+    for start in range(0, len(buckets), batch_size):
+        db.execute(WeeklyTagCount.__table__.insert(), buckets[start:start + batch_size])
+    return len(buckets)
+
@@ -0,0 +1,229 @@
+"""Full-text search over post content and typeahead over users."""
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, literal_column, cast, Float, and_, or_, text, bindparam, desc
+from uuid import UUID
+import base64
+import html
+import re
+from app.models.post import Post
+from app.models.user import User
+from app.models.uuid_type import GUID
+
+# Sentinels wrap highlighted terms so the snippet can be HTML-escaped before
+# they are turned into <mark> tags (post content is untrusted)
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+# posts_fts is keyed on posts' implicit rowid (the primary key is CHAR(36)).
+# VACUUM may renumber rowids, so vacuum_db.py re-reads every post with this
+SQLITE_REBUILD = "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"
+
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(content, content='posts', content_rowid='rowid')",
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, content) VALUES (new.rowid, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF content ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+        INSERT INTO posts_fts(rowid, content) VALUES (new.rowid, new.content);
+    END""",
+    # Index rows that existed before the table was created
+    SQLITE_REBUILD,
+    "CREATE INDEX IF NOT EXISTS ix_users_name_lower ON users (lower(name))",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))",
+]
+
+POSTGRES_DDL = [
+    "ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING GIN (search_vector)",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_users_name_lower ON users (lower(name) text_pattern_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email) text_pattern_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_name_trgm ON users USING GIN (lower(name) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING GIN (lower(email) gin_trgm_ops)",
+]
+
+# Queries shorter than this have no full trigram and cannot use the GIN index
+TRIGRAM_MIN_LENGTH = 3
+
+
+def create_search_index(connection) -> None:
+    """Create the post full-text and user typeahead indexes for the connection's dialect (idempotent)"""
+    statements = POSTGRES_DDL if connection.dialect.name == "postgresql" else SQLITE_DDL
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def rebuild_search_index(connection) -> None:
+    """Re-index every post in posts_fts (SQLite only; PostgreSQL's generated column needs no rebuild)"""
+    if connection.dialect.name != "postgresql":
+        connection.execute(text(SQLITE_REBUILD))
+
+
+def search_terms(q: str) -> list[str]:
+    """Split a query into word tokens; punctuation and operators are dropped"""
+    return re.findall(r"\w+", q.lower())
+
+
+def encode_search_cursor(score: float, post_id: UUID) -> str:
+    raw = f"{score!r}|{post_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, UUID]:
+    """Decode a cursor produced by encode_search_cursor. Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, post_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        return float(score), UUID(post_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def render_snippet(snippet: str | None) -> str | None:
+    """HTML-escape a snippet and turn highlight sentinels into <mark> tags"""
+    if snippet is None:
+        return None
+    escaped = html.escape(snippet)
+    return escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+
+
+def _search_postgres(db: Session, terms: list[str], after, limit: int) -> tuple[list, dict]:
+    tsquery = func.to_tsquery("simple", " & ".join(terms[:-1] + [f"{terms[-1]}:*"]))
+    vector = literal_column("posts.search_vector")
+    # float8 so the score round-trips exactly through the cursor
+    score = cast(func.ts_rank(vector, tsquery), Float).label("score")
+    ranked = select(Post.id.label("id"), score).where(vector.op("@@")(tsquery)).subquery()
+
+    query = select(ranked.c.id, ranked.c.score)
+    if after:
+        after_score, after_id = after
+        query = query.where(or_(
+            ranked.c.score < after_score,
+            and_(ranked.c.score == after_score, ranked.c.id < after_id)
+        ))
+    rows = db.execute(query.order_by(ranked.c.score.desc(), ranked.c.id.desc()).limit(limit + 1)).all()
+    matches = [(row.id, row.score) for row in rows]
+
+    # Headlines are only computed for the returned page
+    page_ids = [post_id for post_id, _ in matches[:limit]]
+    snippets = {}
+    if page_ids:
+        options = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxFragments=1, MaxWords=20, MinWords=5"
+        snippets = dict(db.execute(
+            select(Post.id, func.ts_headline("simple", Post.content, tsquery, options)).where(Post.id.in_(page_ids))
+        ).all())
+    return matches, snippets
+
+
+def _search_sqlite(db: Session, terms: list[str], after, limit: int) -> tuple[list, dict]:
+    match = " ".join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+    # bm25 is lower-is-better; negate it so both backends sort by score DESC
+    cursor_filter = ""
+    params = {"match": match, "limit": limit + 1}
+    if after:
+        cursor_filter = "AND (-bm25(posts_fts) < :after_score OR (-bm25(posts_fts) = :after_score AND p.id < :after_id))"
+        params["after_score"], params["after_id"] = after
+    statement = text(f"""
+        SELECT p.id AS id, -bm25(posts_fts) AS score,
+               snippet(posts_fts, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 16) AS snippet
+        FROM posts_fts JOIN posts p ON p.rowid = posts_fts.rowid
+        WHERE posts_fts MATCH :match {cursor_filter}
+        ORDER BY score DESC, p.id DESC
+        LIMIT :limit
+    """)
+    if after:
+        statement = statement.bindparams(bindparam("after_id", type_=GUID()))
+    rows = db.execute(statement, params).all()
+    # Raw SQL bypasses the GUID type on the way out; ids come back as strings
+    matches = [(UUID(str(row.id)), row.score) for row in rows]
+    return matches, {post_id: row.snippet for (post_id, _), row in zip(matches, rows)}
+
+
+def search_posts(
+    db: Session,
+    q: str,
+    cursor: str | None,
+    limit: int
+) -> tuple[list[tuple[UUID, str | None]], str | None]:
+    """
+    Return ([(post_id, snippet_html)], next_cursor) for the best matches of q,
+    most relevant first. Raises ValueError for a malformed cursor.
+    """
+    terms = search_terms(q)
+    if not terms:
+        return [], None
+    after = decode_search_cursor(cursor) if cursor else None
+
+    if db.get_bind().dialect.name == "postgresql":
+        matches, snippets = _search_postgres(db, terms, after, limit)
+    else:
+        matches, snippets = _search_sqlite(db, terms, after, limit)
+
+    next_cursor = None
+    if len(matches) > limit:
+        matches = matches[:limit]
+        last_id, last_score = matches[-1]
+        next_cursor = encode_search_cursor(last_score, last_id)
+    return [(post_id, render_snippet(snippets.get(post_id))) for post_id, _ in matches], next_cursor
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _ascii_lower(value: str) -> str:
+    """Lowercase only A-Z, matching SQLite's built-in lower()"""
+    return "".join(char.lower() if char.isascii() else char for char in value)
+
+
+def _prefix_filter(db: Session, column, prefix: str):
+    """Indexed case-insensitive prefix match on lower(column) for the session's dialect"""
+    expression = func.lower(column)
+    if db.get_bind().dialect.name == "postgresql":
+        return expression.like(f"{_escape_like(prefix.lower())}%", escape="\\")
+    # SQLite's lower() only folds ASCII, so the prefix must be folded the same
+    # way or names like "Émile" never match. Its LIKE is case-insensitive and
+    # cannot use the expression index; an equivalent half-open range can
+    prefix = _ascii_lower(prefix)
+    return and_(expression >= prefix, expression < prefix + "\uffff")
+
+
+def autocomplete_users(db: Session, q: str, limit: int) -> list[User]:
+    """
+    Return up to `limit` users for a typeahead query: name prefix matches
+    first, then email prefix matches, then (PostgreSQL only) names or emails
+    most similar to q. Each step is a bounded, index-backed query.
+    """
+    prefix = " ".join(q.split())
+    if not prefix:
+        return []
+
+    users: list[User] = []
+    seen: set[UUID] = set()
+
+    def collect(query) -> None:
+        if seen:
+            query = query.filter(User.id.notin_(seen))
+        for user in query.limit(limit - len(users)).all():
+            seen.add(user.id)
+            users.append(user)
+
+    collect(db.query(User).filter(_prefix_filter(db, User.name, prefix)).order_by(func.lower(User.name), User.id))
+    if len(users) < limit:
+        collect(db.query(User).filter(_prefix_filter(db, User.email, prefix)).order_by(func.lower(User.email), User.id))
+
+    if len(users) < limit and db.get_bind().dialect.name == "postgresql" and len(prefix) >= TRIGRAM_MIN_LENGTH:
+        prefix = prefix.lower()
+        name, email = func.lower(User.name), func.lower(User.email)
+        similarity = func.greatest(func.similarity(name, prefix), func.similarity(email, prefix))
+        collect(
+            db.query(User)
+            .filter(or_(name.op("%")(prefix), email.op("%")(prefix)))
+            .order_by(desc(similarity), User.name)
+        )
+    return users
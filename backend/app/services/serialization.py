@@ -0,0 +1,68 @@
+"""Fast JSON serialization for post, comment and user payloads."""
+from fastapi.encoders import jsonable_encoder
+import json
+from app.models.post import Post
+from app.models.comment import Comment
+from app.models.user import User
+
+# orjson is in requirements.txt; fall back to the stdlib if it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value) -> bytes:
+    """Serialize dicts/lists containing UUIDs and datetimes to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(jsonable_encoder(value), separators=(",", ":")).encode()
+
+
+def serialize_user(user: User | None) -> dict | None:
+    """Dict matching app.schemas.user.User"""
+    if user is None:
+        return None
+    return {
+        "email": user.email,
+        "name": user.name,
+        "avatar_url": user.avatar_url,
+        "bio": user.bio,
+        "id": user.id,
+        "created_at": user.created_at,
+        "last_login": user.last_login,
+    }
+
+
+def serialize_comment(comment: Comment, user: User | None) -> dict:
+    """Dict matching app.schemas.comment.CommentWithUser"""
+    return {
+        "content": comment.content,
+        "anonymous_name": comment.anonymous_name,
+        "id": comment.id,
+        "post_id": comment.post_id,
+        "user_id": comment.user_id,
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at,
+        "is_edited": comment.is_edited,
+        "user": serialize_user(user),
+    }
+
+
+def serialize_post(post: Post, user: User | None, comments: list[dict], is_liked: bool) -> dict:
+    """Dict matching app.schemas.post.PostWithUser"""
+    return {
+        "content": post.content,
+        "tags": post.tags or [],
+        "id": post.id,
+        "user_id": post.user_id,
+        "anonymous_name": post.anonymous_name,
+        "created_at": post.created_at,
+        "updated_at": post.updated_at,
+        "is_edited": post.is_edited,
+        "user": serialize_user(user),
+        "comments": comments,
+        "like_count": post.like_count,
+        "comment_count": post.comment_count,
+        "is_liked": is_liked,
+    }
@@ -0,0 +1,49 @@
+"""Process-local registry of tag names."""
+from sqlalchemy.orm import Session
+from typing import Iterable
+import logging
+import threading
+import time
+from app.config import settings
+from app.models.tag import Tag
+
+logger = logging.getLogger(__name__)
+
+
+class TagRegistry:
+    """Copy-on-write set of known tag names"""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._names: frozenset[str] = frozenset()
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        """Replace the registry with every tag name in the database"""
+        names = frozenset(row[0] for row in db.query(Tag.name).all())
+        with self._lock:
+            self._names = names
+            self._loaded_at = time.monotonic()
+        logger.debug(f"Loaded {len(names)} tags into the registry")
+
+    def is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return self.refresh_seconds > 0 and time.monotonic() - self._loaded_at > self.refresh_seconds
+
+    def names(self, db: Session) -> frozenset[str]:
+        """Snapshot of known tag names; (re)loads from db only when stale"""
+        if self.is_stale():
+            self.load(db)
+        return self._names
+
+    def add(self, names: Iterable[str]) -> None:
+        """Record tags created by a committed transaction"""
+        with self._lock:
+            new_names = set(names) - self._names
+            if new_names:
+                self._names = self._names | new_names
+
+
+tag_registry = TagRegistry(refresh_seconds=settings.tag_registry_refresh_seconds)
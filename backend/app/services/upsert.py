@@ -0,0 +1,25 @@
+"""Dialect-aware INSERT ... ON CONFLICT statements."""
+from sqlalchemy.orm import Session
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def dialect_insert(db: Session, table: Table):
+    """insert() construct for the session's dialect, supporting on_conflict_*"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def insert_ignore(db: Session, table: Table):
+    """INSERT into table that silently skips rows conflicting with a unique key"""
+    return dialect_insert(db, table).on_conflict_do_nothing()
+
+
+def insert_or_increment(db: Session, table: Table, values: dict, key_columns: list[str], column: str):
+    """INSERT values, or add values[column] to the existing row's column on a key conflict"""
+    statement = dialect_insert(db, table).values(**values)
+    return statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={column: table.c[column] + statement.excluded[column]}
+    )
@@ -0,0 +1,106 @@
+"""Bounded in-process cache of completed-week report buckets."""
+from collections import OrderedDict
+from datetime import datetime
+from uuid import UUID
+import threading
+import time
+from app.config import settings
+
+WeekKey = tuple[UUID, datetime, int | None]
+WeekBuckets = list[tuple[str, list[UUID]]]
+
+
+class WeekReportCache:
+    """Thread-safe LRU + TTL cache of completed-week buckets with per-user window invalidation"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (utc_start, utc_end, buckets, expires_at)
+        self._entries: OrderedDict[WeekKey, tuple[datetime, datetime, WeekBuckets, float]] = OrderedDict()
+        self._keys_by_user: dict[UUID, set[WeekKey]] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: WeekKey) -> WeekBuckets | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[3] <= time.monotonic():
+                del self._entries[key]
+                self._discard_user_key(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: WeekKey, utc_start: datetime, utc_end: datetime, buckets: WeekBuckets, version: int) -> None:
+        """Store buckets computed from data read at `version`; dropped if a write happened since"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if version != self.version:
+                return
+            self._entries[key] = (utc_start, utc_end, buckets, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._discard_user_key(old_key)
+                self.evictions += 1
+
+    def invalidate(self, user_id: UUID | None, created_at: datetime) -> None:
+        """Drop every cached week of user_id whose UTC window contains created_at"""
+        with self._lock:
+            self.version += 1
+            for key in list(self._keys_by_user.get(user_id, ())):
+                utc_start, utc_end, _, _ = self._entries[key]
+                if utc_start <= created_at < utc_end:
+                    del self._entries[key]
+                    self._discard_user_key(key)
+                    self.invalidations += 1
+
+    def _discard_user_key(self, key: WeekKey) -> None:
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+week_report_cache = WeekReportCache(
+    max_entries=settings.week_cache_max_entries,
+    ttl_seconds=settings.week_cache_ttl_seconds,
+)
+
+
+def invalidate_post_week(user_id: UUID | None, created_at: datetime) -> None:
+    """Invalidate cached weeks containing a post after a write to it commits"""
+    week_report_cache.invalidate(user_id, created_at)
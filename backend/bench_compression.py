@@ -0,0 +1,65 @@
+"""
+Benchmark for response compression of typical feed payloads: bytes on the
+wire and CPU time per response for each gzip level (and brotli quality, if
+the brotli package is installed).
+
+No database is needed; feed pages are built in memory.
+
+Usage:
+    python bench_compression.py [--sizes 20 50 100] [--comments 5] [--repeat 10]
+"""
+import sys
+import os
+import argparse
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_serialization import make_fixtures, fast_path
+from app.middleware.compression import brotli, GzipEncoder, BrotliEncoder
+
+
+def bench(fn, repeat: int) -> float:
+    """Best wall time over repeat runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def encode(encoder, body: bytes) -> bytes:
+    """Compress a whole body the way the middleware does"""
+    return encoder.compress(body) + encoder.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compression of feed payloads")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 50, 100], help="Posts per page")
+    parser.add_argument("--comments", type=int, default=5, help="Comments per post")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per setting (best is reported)")
+    args = parser.parse_args()
+
+    codecs = [(f"gzip-{level}", lambda level=level: GzipEncoder(level)) for level in (1, 6, 9)]
+    if brotli is not None:
+        codecs += [(f"br-{quality}", lambda quality=quality: BrotliEncoder(quality)) for quality in (1, 4, 11)]
+    else:
+        print("brotli not installed; only gzip is measured\n")
+
+    for size in args.sizes:
+        posts, comments_by_post, users = make_fixtures(size, args.comments)
+        body = fast_path(posts, comments_by_post, users)
+        print(f"{size} posts x {args.comments} comments: {len(body):,} bytes uncompressed")
+        for name, make_encoder in codecs:
+            compress = lambda: encode(make_encoder(), body)
+            compressed = compress()
+            elapsed = bench(compress, args.repeat)
+            ratio = len(compressed) / len(body)
+            print(f"  {name:8s} {len(compressed):>9,} bytes ({ratio:6.1%})  {elapsed * 1000:7.2f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
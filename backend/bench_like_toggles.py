@@ -0,0 +1,125 @@
+"""
+Concurrency check for like toggling: fires hundreds of simultaneous toggles
+at one post through toggle_post_like(), then verifies that the stored
+like_count equals COUNT(*) of its likes rows and that no toggle failed.
+
+Several threads share each user, so the same (post, user) pair is toggled
+concurrently as well. By default a scratch SQLite database is created in a
+temporary directory; pass --database-url to run against PostgreSQL (the rows
+it creates are deleted afterwards).
+
+Exits with status 1 if the counter drifted or any toggle raised.
+
+Usage:
+    python bench_like_toggles.py [--threads 200] [--users 60] [--toggles 5] [--database-url URL]
+"""
+import sys
+import os
+import argparse
+import tempfile
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models.user import User
+from app.models.post import Post
+from app.models.like import Like
+from app.services.likes import toggle_post_like
+
+
+def make_engine(database_url: str):
+    if database_url.startswith("sqlite"):
+        # Writers queue on SQLite's database lock instead of failing fast
+        return create_engine(database_url, connect_args={"check_same_thread": False, "timeout": 60})
+    return create_engine(database_url, pool_size=20, max_overflow=0)
+
+
+def run(database_url: str, num_threads: int, num_users: int, toggles: int) -> bool:
+    """Run the check; returns True if the counter matches the likes rows"""
+    engine = make_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = Session()
+    users = [User(email=f"bench-like-{i}-{time.time_ns()}@example.com", name=f"Bench {i}") for i in range(num_users)]
+    db.add_all(users)
+    db.flush()
+    post = Post(user_id=users[0].id, content="Like toggle concurrency check", tags=[])
+    db.add(post)
+    db.commit()
+    post_id = post.id
+    user_ids = [user.id for user in users]
+    db.close()
+
+    errors = []
+    barrier = threading.Barrier(num_threads)
+
+    def worker(index: int):
+        user_id = user_ids[index % len(user_ids)]
+        barrier.wait()
+        for _ in range(toggles):
+            session = Session()
+            try:
+                if toggle_post_like(session, post_id, user_id) is None:
+                    raise RuntimeError("post not found")
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                errors.append(f"{type(e).__name__}: {e}")
+            finally:
+                session.close()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    db = Session()
+    try:
+        like_count = db.query(Post.like_count).filter(Post.id == post_id).scalar()
+        rows = db.query(func.count(Like.id)).filter(Like.post_id == post_id).scalar()
+        total = num_threads * toggles
+        print(f"{total} toggles from {num_threads} threads over {num_users} users in {elapsed:.2f}s "
+              f"({total / elapsed:,.0f}/s)")
+        print(f"  like_count={like_count} likes rows={rows} errors={len(errors)}")
+        for error in errors[:5]:
+            print(f"  {error}")
+
+        # Clean up the rows created for the check
+        db.query(Like).filter(Like.post_id == post_id).delete(synchronize_session=False)
+        db.query(Post).filter(Post.id == post_id).delete(synchronize_session=False)
+        db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+        engine.dispose()
+    return like_count == rows and not errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check like toggling under concurrent load")
+    parser.add_argument("--threads", type=int, default=200, help="Concurrent toggling threads")
+    parser.add_argument("--users", type=int, default=60, help="Distinct users (threads share them unevenly)")
+    parser.add_argument("--toggles", type=int, default=5, help="Toggles per thread")
+    parser.add_argument("--database-url", default=None, help="Database to use (default: scratch SQLite file)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        ok = run(args.database_url, args.threads, args.users, args.toggles)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            ok = run(f"sqlite:///{os.path.join(directory, 'bench_likes.db')}", args.threads, args.users, args.toggles)
+    print("OK" if ok else "FAILED: like_count does not match the likes rows")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
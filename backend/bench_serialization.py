@@ -0,0 +1,118 @@
+"""
+Microbenchmark for post serialization: the old Pydantic response_model path
+versus the dict + orjson path used by the read endpoints.
+
+No database is needed; posts, comments and users are built in memory.
+
+Usage:
+    python bench_serialization.py [--posts 100] [--comments 5] [--repeat 20]
+"""
+import sys
+import os
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from pydantic import TypeAdapter
+from app.models.user import User
+from app.models.post import Post
+from app.models.comment import Comment
+from app.schemas.post import PostWithUser
+from app.schemas.comment import CommentWithUser
+from app.services.serialization import dumps, serialize_post, serialize_comment
+
+
+def make_fixtures(num_posts: int, comments_per_post: int):
+    """Build transient ORM objects shaped like a feed page"""
+    now = datetime.utcnow()
+    users = [
+        User(id=uuid.uuid4(), email=f"user{i}@example.com", name=f"User {i}",
+             avatar_url=f"https://example.com/avatar/{i}.png", bio="Runner and reader",
+             created_at=now, last_login=now)
+        for i in range(10)
+    ]
+    posts = []
+    comments_by_post = {}
+    for i in range(num_posts):
+        author = users[i % len(users)]
+        post = Post(id=uuid.uuid4(), user_id=author.id, content=f"Morning run number {i}, feeling great!" * 3,
+                    tags=["#running", "#gettingup"], created_at=now - timedelta(minutes=i),
+                    updated_at=None, is_edited=False, like_count=i % 7, comment_count=comments_per_post)
+        posts.append(post)
+        comments_by_post[post.id] = [
+            Comment(id=uuid.uuid4(), post_id=post.id, user_id=users[(i + j) % len(users)].id,
+                    content=f"Nice one! {j}", created_at=now, updated_at=None, is_edited=False)
+            for j in range(comments_per_post)
+        ]
+    return posts, comments_by_post, {user.id: user for user in users}
+
+
+def pydantic_path(posts, comments_by_post, users, adapter) -> bytes:
+    """Build PostWithUser objects by hand, then validate and serialize them again as response_model does"""
+    result = []
+    for post in posts:
+        comments = [
+            CommentWithUser(
+                id=comment.id, post_id=comment.post_id, user_id=comment.user_id,
+                anonymous_name=comment.anonymous_name, content=comment.content,
+                created_at=comment.created_at, updated_at=comment.updated_at,
+                is_edited=comment.is_edited, user=users.get(comment.user_id)
+            )
+            for comment in comments_by_post[post.id]
+        ]
+        result.append(PostWithUser(
+            id=post.id, user_id=post.user_id, anonymous_name=post.anonymous_name,
+            content=post.content, tags=post.tags or [], created_at=post.created_at,
+            updated_at=post.updated_at, is_edited=post.is_edited, user=users.get(post.user_id),
+            comments=comments, like_count=post.like_count, comment_count=post.comment_count,
+            is_liked=False
+        ))
+    validated = adapter.validate_python(result, from_attributes=True)
+    return adapter.dump_json(validated)
+
+
+def fast_path(posts, comments_by_post, users) -> bytes:
+    """Build plain dicts and serialize once with orjson"""
+    result = []
+    for post in posts:
+        comments = [serialize_comment(comment, users.get(comment.user_id)) for comment in comments_by_post[post.id]]
+        result.append(serialize_post(post, users.get(post.user_id), comments, False))
+    return dumps(result)
+
+
+def bench(fn, repeat: int) -> float:
+    """Best wall time over repeat runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark post serialization paths")
+    parser.add_argument("--posts", type=int, default=100, help="Posts per page")
+    parser.add_argument("--comments", type=int, default=5, help="Comments per post")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per path (best is reported)")
+    args = parser.parse_args()
+
+    posts, comments_by_post, users = make_fixtures(args.posts, args.comments)
+    adapter = TypeAdapter(list[PostWithUser])
+
+    baseline = bench(lambda: pydantic_path(posts, comments_by_post, users, adapter), args.repeat)
+    fast = bench(lambda: fast_path(posts, comments_by_post, users), args.repeat)
+    size = len(fast_path(posts, comments_by_post, users))
+
+    print(f"{args.posts} posts x {args.comments} comments, {size} bytes of JSON")
+    print(f"  pydantic response_model: {baseline * 1000:8.2f} ms  ({baseline / args.posts * 1e6:7.1f} us/post)")
+    print(f"  dict + orjson:           {fast * 1000:8.2f} ms  ({fast / args.posts * 1e6:7.1f} us/post)")
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
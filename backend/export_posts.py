@@ -0,0 +1,60 @@
+"""
+Script to export posts (with tags, counts and authors) as NDJSON for
+analytics and backups. Rows are streamed through a server-side cursor, so
+memory stays flat no matter how large the posts table is.
+
+Usage:
+    python export_posts.py [--output posts.ndjson] [--user-id UUID]
+                           [--start 2026-01-01] [--end 2026-01-31]
+                           [--timezone-offset -480] [--batch-size 1000]
+"""
+import sys
+import os
+import argparse
+from datetime import datetime
+from uuid import UUID
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import SessionLocal
+from app.services.dates import local_day_bounds_utc
+from app.services.export import iter_post_export_lines
+
+
+def export_posts(output, user_id=None, start_date=None, end_date=None, timezone_offset=None, batch_size=1000):
+    """Write matching posts to output (a binary file object), one JSON object per line"""
+    start = local_day_bounds_utc(start_date, timezone_offset)[0] if start_date else None
+    end = local_day_bounds_utc(end_date, timezone_offset)[1] if end_date else None
+    
+    db = SessionLocal()
+    try:
+        posts_exported = 0
+        for line in iter_post_export_lines(db, user_id, start, end, batch_size):
+            output.write(line)
+            posts_exported += 1
+        output.flush()
+        print(f"Exported {posts_exported} posts", file=sys.stderr)
+    finally:
+        db.close()
+
+
+def parse_date(value: str):
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export posts as NDJSON")
+    parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    parser.add_argument("--user-id", type=UUID, help="Only export this user's posts")
+    parser.add_argument("--start", type=parse_date, help="First local day to include (YYYY-MM-DD)")
+    parser.add_argument("--end", type=parse_date, help="Last local day to include (YYYY-MM-DD)")
+    parser.add_argument("--timezone-offset", type=int, help="Minutes from UTC used for --start/--end (default: UTC)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows fetched per round trip")
+    args = parser.parse_args()
+    
+    if args.output:
+        with open(args.output, "wb") as f:
+            export_posts(f, args.user_id, args.start, args.end, args.timezone_offset, args.batch_size)
+    else:
+        export_posts(sys.stdout.buffer, args.user_id, args.start, args.end, args.timezone_offset, args.batch_size)
@@ -4,10 +4,14 @@ Run this after setting up your .env file and before running migrations.
 """
 from app.database import engine, Base
 from app.models import User, Post, Comment, Like, Tag
+from app.services.search import create_search_index
 
 def init_db():
     """Create all database tables"""
     Base.metadata.create_all(bind=engine)
+    # Full-text search index lives outside the ORM metadata
+    with engine.begin() as connection:
+        create_search_index(connection)
     print("Database tables created successfully!")
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 from app.database import SessionLocal
 from app.models.user import User
 from app.models.post import Post
+from app.services.rollup import rebuild_weekly_tag_counts
 
 # Preset tags
 PRESET_TAGS = ['#gettingup', '#running', '#reading']
@@ -154,6 +155,9 @@ def inject_fake_data():
                 db.add(post)
                 posts_created += 1
         
+        db.flush()
+        # Posts were inserted directly, so recompute the weekly rollup
+        rebuild_weekly_tag_counts(db)
         db.commit()
         print(f"Successfully created {posts_created} fake posts across {num_weeks} weeks")
         print(f"User ID: {test_user.id}")
@@ -0,0 +1,41 @@
+"""
+Rebuild the weekly_tag_counts rollup from the posts table.
+
+The add_weekly_tag_counts migration backfills the table; run this whenever
+the rollup is suspected to have drifted. The table is replaced in a single transaction, so
+readers see either the old or the new rollup.
+
+Usage:
+    python rebuild_weekly_rollup.py [--batch-size 1000]
+"""
+import sys
+import os
+import argparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import SessionLocal
+from app.services.rollup import rebuild_weekly_tag_counts
+
+
+def rebuild_weekly_rollup(batch_size: int = 1000):
+    """Recompute every (user, week, tag) bucket"""
+    db = SessionLocal()
+    try:
+        buckets = rebuild_weekly_tag_counts(db, batch_size)
+        db.commit()
+        print(f"Rebuild complete! Wrote {buckets} weekly tag buckets")
+    except Exception as e:
+        db.rollback()
+        print(f"Error rebuilding weekly rollup: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the weekly tag rollup table")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Posts streamed / buckets inserted per batch")
+    args = parser.parse_args()
+    rebuild_weekly_rollup(args.batch_size)
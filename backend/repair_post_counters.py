@@ -0,0 +1,59 @@
+"""
+Repair script to recompute Post.like_count and Post.comment_count from the
+likes and comments tables. Safe to run at any time; posts are processed in
+batches, each committed in its own transaction.
+
+Usage:
+    python repair_post_counters.py [--batch-size 500]
+"""
+import sys
+import os
+import argparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.database import SessionLocal
+from app.models.post import Post
+from app.services.counters import recount_posts
+
+
+def repair_post_counters(batch_size: int = 500):
+    """Recompute counters for every post, batch_size posts at a time"""
+    db = SessionLocal()
+    try:
+        posts_scanned = 0
+        posts_fixed = 0
+        last_id = None
+        
+        while True:
+            query = db.query(Post.id).order_by(Post.id)
+            if last_id is not None:
+                query = query.filter(Post.id > last_id)
+            post_ids = [row[0] for row in query.limit(batch_size).all()]
+            if not post_ids:
+                break
+            
+            posts_fixed += recount_posts(db, post_ids)
+            db.commit()
+            posts_scanned += len(post_ids)
+            last_id = post_ids[-1]
+            print(f"Scanned {posts_scanned} posts, fixed {posts_fixed} so far...")
+        
+        print(f"\nRepair complete!")
+        print(f"  - Scanned {posts_scanned} posts")
+        print(f"  - Fixed {posts_fixed} posts with stale counters")
+        
+    except Exception as e:
+        db.rollback()
+        print(f"Error repairing post counters: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute denormalized post counters")
+    parser.add_argument("--batch-size", type=int, default=500, help="Posts per transaction")
+    args = parser.parse_args()
+    repair_post_counters(args.batch_size)
@@ -0,0 +1,13 @@
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_like_toggles import run
+
+
+def test_concurrent_toggles_keep_like_count_in_sync(tmp_path):
+    """like_count equals COUNT(likes) after concurrent toggles, with no failed toggle"""
+    database_url = f"sqlite:///{tmp_path / 'likes.db'}"
+    assert run(database_url, num_threads=50, num_users=12, toggles=4)
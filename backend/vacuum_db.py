@@ -0,0 +1,41 @@
+"""
+Compact the SQLite database and re-sync the post search index.
+
+posts_fts is keyed on posts' implicit rowid, which VACUUM may renumber, so a
+bare VACUUM can leave search results pointing at the wrong posts. This script
+runs VACUUM and then an FTS 'rebuild'. PostgreSQL needs neither step
+(autovacuum handles it and the search column is generated), so it exits.
+
+Usage:
+    python vacuum_db.py
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import text
+from app.database import engine
+from app.services.search import rebuild_search_index
+
+
+def vacuum_db():
+    """VACUUM the SQLite database, then rebuild posts_fts"""
+    if engine.dialect.name == "postgresql":
+        print("PostgreSQL database: nothing to do")
+        return
+    try:
+        # VACUUM cannot run inside a transaction
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM"))
+        with engine.begin() as connection:
+            rebuild_search_index(connection)
+        print("Vacuum complete! Search index rebuilt")
+    except Exception as e:
+        print(f"Error vacuuming database: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    vacuum_db()
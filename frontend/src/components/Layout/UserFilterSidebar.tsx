@@ -1,6 +1,6 @@
 import { useState } from 'react';
 import { UserAvatar } from '../User/UserAvatar';
-import { useUsers } from '../../hooks/useUsers';
+import { useUsers, useUserAutocomplete } from '../../hooks/useUsers';
 
 type SidebarTab = 'user-filter' | 'time-filter';
 
@@ -15,7 +15,12 @@ interface UserFilterSidebarProps {
 export function UserFilterSidebar({ selectedUserId, onUserSelect, selectedDate, onDateSelect, showTimeFilter = true }: UserFilterSidebarProps) {
   const [isExpanded, setIsExpanded] = useState(false);
   const [activeTab, setActiveTab] = useState<SidebarTab>('user-filter');
-  const { data: users, isLoading } = useUsers();
+  const [userQuery, setUserQuery] = useState('');
+  const { data: allUsers, isLoading: isLoadingAll } = useUsers();
+  const { data: matchedUsers, isLoading: isLoadingMatches } = useUserAutocomplete(userQuery, 20);
+  const isSearching = userQuery.trim().length > 0;
+  const users = isSearching ? matchedUsers : allUsers;
+  const isLoading = isSearching ? isLoadingMatches : isLoadingAll;
 
   const handleUserClick = (userId: string) => {
     if (selectedUserId === userId) {
@@ -79,6 +84,13 @@ export function UserFilterSidebar({ selectedUserId, onUserSelect, selectedDate,
           <div className="flex-1 overflow-y-auto p-3 sm:p-4">
             {activeTab === 'user-filter' && (
               <div>
+                <input
+                  type="text"
+                  value={userQuery}
+                  onChange={(e) => setUserQuery(e.target.value)}
+                  placeholder="Find a user..."
+                  className="w-full mb-3 p-2 border border-zinc-300 rounded-lg bg-white text-zinc-900 text-sm focus:outline-none focus:ring-2 focus:ring-zinc-500"
+                />
                 {isLoading ? (
                   <div className="flex items-center justify-center py-8">
                     <div className="animate-spin rounded-full h-6 w-6 border-b-2 border-zinc-600"></div>
@@ -146,6 +146,11 @@ export function PostCard({ post }: PostCardProps) {
                       <span className="text-white">{user.name}</span>
                     </div>
                   ))}
+                  {likersData.like_count > likersData.users.length && (
+                    <div className="text-xs text-zinc-400">
+                      and {likersData.like_count - likersData.users.length} more
+                    </div>
+                  )}
                 </div>
               </div>
             )}
@@ -1,6 +1,6 @@
 import { useState } from 'react';
-import { useUsers } from '../../hooks/useUsers';
-import { useWeeklyReports } from '../../hooks/usePosts';
+import { useSiteWeeklyReports, useWeeklyBucketPosts } from '../../hooks/usePosts';
+import type { WeeklyReport } from '../../hooks/usePosts';
 import { PostCard } from '../Post/PostCard';
 import { format, parseISO } from 'date-fns';
 import { UserAvatar } from './UserAvatar';
@@ -10,7 +10,13 @@ interface AllUsersWeeklyReportProps {
 }
 
 export function AllUsersWeeklyReport({ selectedUserId }: AllUsersWeeklyReportProps) {
-  const { data: users, isLoading: usersLoading } = useUsers();
+  const {
+    data,
+    isLoading: reportsLoading,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useSiteWeeklyReports(selectedUserId, 'counts');
   const [expandedCategories, setExpandedCategories] = useState<Map<string, Set<string>>>(new Map());
   const [expandedUsers, setExpandedUsers] = useState<Set<string>>(new Set());
 
@@ -43,7 +49,7 @@ export function AllUsersWeeklyReport({ selectedUserId }: AllUsersWeeklyReportPro
     });
   };
 
-  if (usersLoading) {
+  if (reportsLoading) {
     return (
       <div className="flex items-center justify-center py-12">
         <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-white"></div>
@@ -52,7 +58,9 @@ export function AllUsersWeeklyReport({ selectedUserId }: AllUsersWeeklyReportPro
     );
   }
 
-  if (!users || users.length === 0) {
+  const userReports = data?.pages.flatMap((page) => page.items) ?? [];
+
+  if (userReports.length === 0) {
     return (
       <div className="text-center text-sm text-zinc-400 py-12">
         No users found
@@ -60,29 +68,35 @@ export function AllUsersWeeklyReport({ selectedUserId }: AllUsersWeeklyReportPro
     );
   }
 
-  // Filter users if selectedUserId is provided
-  const displayUsers = selectedUserId 
-    ? users.filter(u => u.id === selectedUserId)
-    : users;
-
   return (
     <div className="space-y-6">
-      {displayUsers.map((user) => (
+      {userReports.map(({ user, reports }) => (
         <UserWeeklyReportSection
           key={user.id}
           user={user}
+          reports={reports}
           expandedUsers={expandedUsers}
           onToggleUser={toggleUser}
           expandedCategories={expandedCategories}
           onToggleCategory={toggleCategory}
         />
       ))}
+      {hasNextPage && (
+        <button
+          onClick={() => fetchNextPage()}
+          disabled={isFetchingNextPage}
+          className="w-full px-4 py-2 bg-zinc-800 border border-zinc-700 text-sm text-zinc-300 rounded-lg hover:bg-zinc-700 transition-colors disabled:opacity-50"
+        >
+          {isFetchingNextPage ? 'Loading...' : 'Load more users'}
+        </button>
+      )}
     </div>
   );
 }
 
 interface UserWeeklyReportSectionProps {
   user: { id: string; name: string; avatar_url: string | null };
+  reports: WeeklyReport[];
   expandedUsers: Set<string>;
   onToggleUser: (userId: string) => void;
   expandedCategories: Map<string, Set<string>>;
@@ -91,29 +105,15 @@ interface UserWeeklyReportSectionProps {
 
 function UserWeeklyReportSection({ 
   user, 
+  reports,
   expandedUsers, 
   onToggleUser,
   expandedCategories,
   onToggleCategory
 }: UserWeeklyReportSectionProps) {
-  const { data: reports, isLoading } = useWeeklyReports(user.id);
   const isUserExpanded = expandedUsers.has(user.id);
 
-  if (isLoading) {
-    return (
-      <div className="bg-zinc-800 border border-zinc-700 rounded-2xl shadow-sm p-4">
-        <div className="flex items-center gap-3 mb-4">
-          <UserAvatar name={user.name} avatarUrl={user.avatar_url} size="md" />
-          <span className="text-sm font-semibold text-white">{user.name}</span>
-        </div>
-        <div className="flex items-center justify-center py-8">
-          <div className="animate-spin rounded-full h-6 w-6 border-b-2 border-white"></div>
-        </div>
-      </div>
-    );
-  }
-
-  if (!reports || reports.length === 0) {
+  if (reports.length === 0) {
     return (
       <div className="bg-zinc-800 border border-zinc-700 rounded-2xl shadow-sm p-4">
         <button
@@ -188,11 +188,12 @@ function UserWeeklyReportSection({
                             </span>
                           </button>
                           {isExpanded && (
-                            <div className="border-t border-zinc-700 p-3 space-y-3 bg-zinc-900">
-                              {category.posts.map((post) => (
-                                <PostCard key={post.id} post={post} />
-                              ))}
-                            </div>
+                            <BucketPosts
+                              userId={user.id}
+                              tag={category.tag}
+                              startDate={report.week_start.slice(0, 10)}
+                              endDate={report.week_end.slice(0, 10)}
+                            />
                           )}
                         </div>
                       );
@@ -207,3 +208,38 @@ function UserWeeklyReportSection({
     </div>
   );
 }
+
+interface BucketPostsProps {
+  userId: string;
+  tag: string;
+  startDate: string;
+  endDate: string;
+}
+
+// Posts of one expanded category, fetched only when it is opened
+function BucketPosts({ userId, tag, startDate, endDate }: BucketPostsProps) {
+  const { data, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } =
+    useWeeklyBucketPosts(userId, tag, startDate, endDate);
+  const posts = data?.pages.flatMap((page) => page.items) ?? [];
+
+  return (
+    <div className="border-t border-zinc-700 p-3 space-y-3 bg-zinc-900">
+      {isLoading ? (
+        <div className="flex items-center justify-center py-4">
+          <div className="animate-spin rounded-full h-5 w-5 border-b-2 border-white"></div>
+        </div>
+      ) : (
+        posts.map((post) => <PostCard key={post.id} post={post} />)
+      )}
+      {hasNextPage && (
+        <button
+          onClick={() => fetchNextPage()}
+          disabled={isFetchingNextPage}
+          className="w-full px-3 py-1 text-xs text-zinc-300 rounded-lg hover:bg-zinc-800 transition-colors disabled:opacity-50"
+        >
+          {isFetchingNextPage ? 'Loading...' : 'Show more posts'}
+        </button>
+      )}
+    </div>
+  );
+}
@@ -13,8 +13,11 @@ interface PostLikesResponse {
     name: string;
     avatar_url: string | null;
   }>;
+  next_cursor: string | null;
 }
 
+export type LikeStatusMap = Record<string, { like_count: number; is_liked: boolean }>;
+
 export function useToggleLike() {
   const queryClient = useQueryClient();
   
@@ -27,14 +30,29 @@ export function useToggleLike() {
       queryClient.invalidateQueries({ queryKey: ['posts'] });
       queryClient.invalidateQueries({ queryKey: ['post', postId] });
       queryClient.invalidateQueries({ queryKey: ['post-likes', postId] });
+      queryClient.invalidateQueries({ queryKey: ['like-status'] });
     },
   });
 }
 
+// First page of likers, most recent first; like_count is the full total
 export function usePostLikes(postId: string, enabled: boolean = false) {
   return useQuery({
     queryKey: ['post-likes', postId],
-    queryFn: () => apiRequest<PostLikesResponse>(`/api/posts/${postId}/likes`),
+    queryFn: () => apiRequest<PostLikesResponse>(`/api/posts/${postId}/likes?limit=20`),
     enabled: enabled,
   });
 }
+
+// Fresh like_count/is_liked for posts already on screen, without refetching them
+export function useLikeStatus(postIds: string[], enabled: boolean = true) {
+  return useQuery({
+    queryKey: ['like-status', [...postIds].sort()],
+    queryFn: () =>
+      apiRequest<LikeStatusMap>('/api/likes/status', {
+        method: 'POST',
+        body: JSON.stringify({ post_ids: postIds }),
+      }),
+    enabled: enabled && postIds.length > 0,
+  });
+}
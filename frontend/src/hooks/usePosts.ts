@@ -1,4 +1,4 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { apiRequest } from '../services/api';
 
 export interface Post {
@@ -17,6 +17,7 @@ export interface Post {
   } | null;
   comments: Comment[];
   like_count: number;
+  comment_count: number;
   is_liked: boolean;
 }
 
@@ -36,20 +37,33 @@ export interface Comment {
   } | null;
 }
 
+export interface PostPage {
+  items: Post[];
+  next_cursor: string | null;
+}
+
 export interface PostCreate {
   content: string;
   tags?: string[];
 }
 
-export function usePosts(userId?: string, date?: string) {
+export function usePosts(userId?: string, date?: string, tags?: string[], tagMatch: 'any' | 'all' = 'any') {
   return useQuery({
-    queryKey: ['posts', userId, date],
+    queryKey: ['posts', userId, date, tags, tagMatch],
     queryFn: async () => {
       const params = new URLSearchParams();
       if (userId) params.append('user_id', userId);
-      if (date) params.append('date', date);
+      if (tags && tags.length > 0) {
+        tags.forEach((tag) => params.append('tag', tag));
+        params.append('tag_match', tagMatch);
+      }
+      if (date) {
+        params.append('date', date);
+        params.append('timezone_offset', String(getTimezoneOffset()));
+      }
       const url = params.toString() ? `/api/posts?${params.toString()}` : '/api/posts';
-      return apiRequest<Post[]>(url);
+      const page = await apiRequest<PostPage>(url);
+      return page.items;
     },
   });
 }
@@ -147,3 +161,54 @@ export function useWeeklyReports(userId: string) {
     enabled: !!userId,
   });
 }
+
+export interface UserWeeklyReports {
+  user: {
+    id: string;
+    name: string;
+    avatar_url: string | null;
+  };
+  reports: WeeklyReport[];
+}
+
+export interface WeeklyReportPage {
+  items: UserWeeklyReports[];
+  next_cursor: string | null;
+}
+
+// Every user's weekly reports in one request per page of users. With
+// detail 'counts' categories carry no posts; load them with useWeeklyBucketPosts.
+export function useSiteWeeklyReports(userId?: string | null, detail: 'counts' | 'posts' = 'posts') {
+  return useInfiniteQuery({
+    queryKey: ['weekly-reports', 'site', userId, detail],
+    queryFn: ({ pageParam }) => {
+      const params = new URLSearchParams();
+      params.append('timezone_offset', String(getTimezoneOffset()));
+      params.append('detail', detail);
+      if (userId) params.append('user_id', userId);
+      if (pageParam) params.append('cursor', pageParam);
+      return apiRequest<WeeklyReportPage>(`/api/reports/weekly?${params.toString()}`);
+    },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+  });
+}
+
+// Posts behind one tag/week bucket of a count-only report
+export function useWeeklyBucketPosts(userId: string, tag: string, startDate: string, endDate: string, enabled = true) {
+  return useInfiniteQuery({
+    queryKey: ['weekly-bucket-posts', userId, tag, startDate, endDate],
+    queryFn: ({ pageParam }) => {
+      const params = new URLSearchParams();
+      params.append('tag', tag);
+      params.append('start_date', startDate);
+      params.append('end_date', endDate);
+      params.append('timezone_offset', String(getTimezoneOffset()));
+      if (pageParam) params.append('cursor', pageParam);
+      return apiRequest<PostPage>(`/api/users/${userId}/weekly-posts?${params.toString()}`);
+    },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+    enabled,
+  });
+}
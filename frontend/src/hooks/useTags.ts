@@ -11,6 +11,20 @@ export function useTags() {
   });
 }
 
+export interface TagUsage {
+  name: string;
+  count: number;
+}
+
+export function useTagUsage(prefix = '', limit = 20) {
+  return useQuery({
+    queryKey: ['tags', 'usage', prefix, limit],
+    queryFn: () =>
+      apiRequest<TagUsage[]>(`/api/tags?prefix=${encodeURIComponent(prefix)}&limit=${limit}`),
+    staleTime: 60 * 1000,
+  });
+}
+
 export function useInvalidateTags() {
   const queryClient = useQueryClient();
   return () => {
@@ -24,6 +24,15 @@ export function useUsers() {
   });
 }
 
+export function useUserAutocomplete(query: string, limit = 10) {
+  const q = query.trim();
+  return useQuery({
+    queryKey: ['users', 'autocomplete', q, limit],
+    queryFn: () => apiRequest<User[]>(`/api/users/autocomplete?q=${encodeURIComponent(q)}&limit=${limit}`),
+    enabled: q.length > 0,
+  });
+}
+
 export function useUpdateUser() {
   const queryClient = useQueryClient();
   